@@ -16,6 +16,7 @@ import androidx.lifecycle.DefaultLifecycleObserver
 import androidx.lifecycle.LifecycleOwner
 import androidx.lifecycle.ProcessLifecycleOwner
 import androidx.work.Configuration
+import com.goterl.lazysodium.LazySodiumAndroid
 import com.whisper2.app.core.Logger
 import com.whisper2.app.data.local.prefs.SecureStorage
 import com.whisper2.app.data.network.ws.WsClientImpl
@@ -42,6 +43,10 @@ class App : Application(), DefaultLifecycleObserver {
         const val CALLS_CHANNEL_ID = "calls"
         const val CALLS_CHANNEL_ID_V2 = "calls_v2"  // Silent version for existing noisy channels
 
+        // Bump the suffix whenever a channel definition changes so the
+        // creation pass runs once more.
+        private const val CHANNELS_CREATED_KEY = "notification_channels_created_v1"
+
         // Cached channel ID for use by CallForegroundService
         @Volatile
         var currentCallsChannelId: String = CALLS_CHANNEL_ID
@@ -60,6 +65,9 @@ class App : Application(), DefaultLifecycleObserver {
     @Inject
     lateinit var secureStorage: dagger.Lazy<SecureStorage>
 
+    @Inject
+    lateinit var lazySodium: dagger.Lazy<LazySodiumAndroid>
+
     // Lock screen state
     private val _isLocked = MutableStateFlow(false)
     val isLocked: StateFlow<Boolean> = _isLocked.asStateFlow()
@@ -72,11 +80,22 @@ class App : Application(), DefaultLifecycleObserver {
 
     override fun onCreate() {
         super<Application>.onCreate()
-        createNotificationChannels()
+        createNotificationChannelsIfNeeded()
 
         // Register app lifecycle observer
         ProcessLifecycleOwner.get().lifecycle.addObserver(this)
 
+        // Warm the libsodium singleton off the main thread: first touch
+        // dlopens the .so and registers its natives, and without this the
+        // load lands on whichever main-thread path first needs crypto.
+        appScope.launch(Dispatchers.IO) {
+            try {
+                lazySodium.get()
+            } catch (e: Exception) {
+                Logger.w("[App] libsodium warm-up failed: ${e.message}")
+            }
+        }
+
         // Setup network monitoring
         setupNetworkMonitoring()
 
@@ -334,6 +353,21 @@ class App : Application(), DefaultLifecycleObserver {
         return CALLS_CHANNEL_ID
     }
 
+    /**
+     * Channels persist across app restarts and recreation is idempotent,
+     * but each createNotificationChannel call is a binder IPC into
+     * system_server on the cold-start critical path. A prefs flag skips
+     * the whole pass after the first launch; the foreground services
+     * keep their own ensure-on-use safety for the calls/connection
+     * channels, so nothing depends on this running again.
+     */
+    private fun createNotificationChannelsIfNeeded() {
+        val prefs = getSharedPreferences("app_prefs", Context.MODE_PRIVATE)
+        if (prefs.getBoolean(CHANNELS_CREATED_KEY, false)) return
+        createNotificationChannels()
+        prefs.edit().putBoolean(CHANNELS_CREATED_KEY, true).apply()
+    }
+
     private fun createNotificationChannels() {
         if (Build.VERSION.SDK_INT >= Build.VERSION_CODES.O) {
             val nm = getSystemService(NotificationManager::class.java)
@@ -31,6 +31,10 @@ object Constants {
     const val MAX_BACKUP_SIZE = 256 * 1024
 
     const val HEARTBEAT_INTERVAL_MS = 30_000L
+    // Reconnect delays are drawn with full jitter - uniform in [0, cap]
+    // where cap doubles per attempt up to the max - by WsReconnectPolicy,
+    // the single owner of the backoff formula. Anything that needs a
+    // retry delay should go through it rather than re-deriving one here.
     const val RECONNECT_BASE_DELAY_MS = 1000L
     const val RECONNECT_MAX_DELAY_MS = 30_000L
     const val RECONNECT_MAX_ATTEMPTS = 5
@@ -41,6 +45,11 @@ object Constants {
     const val KEYSTORE_ALIAS = "whisper2_wrapper_key"
     const val PLATFORM = "android"
 
+    // Wire-format message types. Kept as const String (not an enum): the
+    // wire carries strings, iOS/server share the same literals, and a
+    // `when (frame.type)` over const vals already compiles to a hashCode
+    // switch plus one equals - the same O(1) dispatch an enum lookup
+    // table would buy, without a mapping layer on every frame.
     object MsgType {
         // Auth
         const val REGISTER_BEGIN = "register_begin"
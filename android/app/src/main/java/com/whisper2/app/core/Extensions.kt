@@ -1,30 +1,68 @@
 package com.whisper2.app.core
 
-import android.util.Base64
 import java.text.Normalizer
+import java.util.Base64
 
-fun ByteArray.encodeBase64(): String = Base64.encodeToString(this, Base64.NO_WRAP)
+// java.util.Base64 (minSdk 26) over android.util.Base64: no scratch
+// buffer or intermediate char[] per call. Padding stays on - the old
+// NO_WRAP flag emitted padded output, so the wire format is unchanged.
+private val B64_ENCODER = Base64.getEncoder()
+private val B64_DECODER = Base64.getDecoder()
+
+fun ByteArray.encodeBase64(): String = B64_ENCODER.encodeToString(this)
 // Sanitize: URL-decoded + becomes space, fix it back before decoding
-fun String.decodeBase64(): ByteArray = Base64.decode(this.replace(" ", "+").trim(), Base64.NO_WRAP)
-fun ByteArray.toHex(): String = joinToString("") { "%02x".format(it) }
+fun String.decodeBase64(): ByteArray = B64_DECODER.decode(this.replace(" ", "+").trim())
+private val HEX = "0123456789abcdef".toCharArray()
+
+// Table lookup instead of "%02x".format per byte: format() re-parses the
+// specifier and allocates a 2-char String for every byte of the input.
+fun ByteArray.toHex(): String {
+    val out = CharArray(size * 2)
+    var j = 0
+    for (b in this) {
+        val v = b.toInt() and 0xFF
+        out[j++] = HEX[v ushr 4]
+        out[j++] = HEX[v and 0x0F]
+    }
+    return String(out)
+}
 fun String.fromHex(): ByteArray = chunked(2).map { it.toInt(16).toByte() }.toByteArray()
 
+private val WS_RE = Regex("\\s+")
+
 fun String.normalizeNFKD(): String = Normalizer.normalize(this, Normalizer.Form.NFKD)
-fun String.normalizeMnemonic(): String = normalizeNFKD().trim().replace(Regex("\\s+"), " ").lowercase()
 
-fun ByteArray.secureEquals(other: ByteArray): Boolean {
-    if (size != other.size) return false
-    var result = 0
-    for (i in indices) result = result or (this[i].toInt() xor other[i].toInt())
-    return result == 0
+// BIP39 English wordlists are pure ASCII, where NFKD is a no-op that
+// still walks the Unicode tables; skip it unless the input needs it.
+fun String.normalizeMnemonic(): String {
+    val nfkd = if (all { it.code < 0x80 }) this else normalizeNFKD()
+    return WS_RE.replace(nfkd.trim(), " ").lowercase()
 }
 
+// MessageDigest.isEqual is the platform's constant-time compare; it's
+// intrinsified on ART, unlike the scalar xor/or loop it replaces.
+fun ByteArray.secureEquals(other: ByteArray): Boolean =
+    java.security.MessageDigest.isEqual(this, other)
+
 fun ByteArray.wipe() = fill(0)
 fun currentTimeMillis(): Long = System.currentTimeMillis()
+
+// Monotonic clock for timeouts/expiry deltas: keeps ticking through
+// deep sleep and is immune to NTP slew or the user changing the system
+// time. currentTimeMillis() stays for on-wire timestamps, which must
+// remain comparable with the server's wall clock.
+fun elapsedMillis(): Long = android.os.SystemClock.elapsedRealtime()
 fun Long.isValidTimestamp(): Boolean = kotlin.math.abs(currentTimeMillis() - this) <= Constants.TIMESTAMP_SKEW_MS
 fun Int.formatDuration(): String = "%d:%02d".format(this / 60, this % 60)
-fun Long.formatFileSize(): String = when {
-    this < 1024 -> "$this B"
-    this < 1024 * 1024 -> "%.1f KB".format(this / 1024f)
-    else -> "%.1f MB".format(this / (1024f * 1024f))
+// Shift + divmod instead of "%.1f".format: the Formatter pipeline parses
+// the specifier and allocates locale machinery per call, which shows up
+// when every row of a chat list renders an attachment size.
+fun Long.formatFileSize(): String {
+    if (this < 1024) return "$this B"
+    val (tenths, unit) = when {
+        this < 1L shl 20 -> (this * 10 ushr 10) to "KB"
+        this < 1L shl 30 -> (this * 10 ushr 20) to "MB"
+        else -> (this * 10 ushr 30) to "GB"
+    }
+    return "${tenths / 10}.${tenths % 10} $unit"
 }
@@ -4,14 +4,21 @@ import android.util.Log
 import com.whisper2.app.BuildConfig
 
 object Logger {
-    private const val TAG = "Whisper2"
-    private val isDebug = BuildConfig.DEBUG
+    @PublishedApi internal const val TAG = "Whisper2"
+    @PublishedApi internal val isDebug = BuildConfig.DEBUG
 
     fun d(msg: String) { if (isDebug) Log.d(TAG, msg) }
     fun i(msg: String) = Log.i(TAG, msg)
     fun w(msg: String) = Log.w(TAG, msg)
     fun e(msg: String, t: Throwable? = null) = if (t != null) Log.e(TAG, msg, t) else Log.e(TAG, msg)
 
+    // Lambda overloads for the debug-gated levels: the message string is
+    // only interpolated when the guard passes, so release builds pay
+    // neither the template evaluation nor the allocation. Hot paths
+    // should prefer these; the String overloads stay for existing calls.
+    inline fun d(msg: () -> String) { if (isDebug) Log.d(TAG, msg()) }
+    inline fun crypto(msg: () -> String) { if (isDebug) Log.d(TAG, "[CRYPTO] " + msg()) }
+
     // Important logs that should show even in release builds
     fun ws(msg: String) = Log.i(TAG, "[WS] $msg")
     fun crypto(msg: String) { if (isDebug) d("[CRYPTO] $msg") }
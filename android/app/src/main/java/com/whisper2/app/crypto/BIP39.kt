@@ -7,6 +7,10 @@ import java.security.MessageDigest
 import java.security.SecureRandom
 import javax.crypto.SecretKeyFactory
 import javax.crypto.spec.PBEKeySpec
+import kotlinx.coroutines.Dispatchers
+import kotlinx.coroutines.async
+import kotlinx.coroutines.awaitAll
+import kotlinx.coroutines.coroutineScope
 
 /**
  * BIP39 Mnemonic generation and seed derivation.
@@ -14,6 +18,108 @@ import javax.crypto.spec.PBEKeySpec
  */
 object BIP39 {
 
+    // Prefer the Conscrypt/AndroidOpenSSL provider, which runs PBKDF2 in
+    // native OpenSSL instead of a managed HMAC loop; fall back to whatever
+    // the platform resolves. Looked up once instead of per import.
+    private val pbkdf2Factory: SecretKeyFactory by lazy {
+        try {
+            SecretKeyFactory.getInstance("PBKDF2WithHmacSHA512", "AndroidOpenSSL")
+        } catch (_: Exception) {
+            SecretKeyFactory.getInstance("PBKDF2WithHmacSHA512")
+        }
+    }
+
+    // True when the resolved factory is the BoringSSL-backed provider,
+    // whose PBKDF2 runs in libcrypto with SHA-NI/ARMv8-SHA512 dispatch.
+    // Most Android releases don't register PBKDF2 there, in which case
+    // the clone-based managed loop below is the fastest path available.
+    private val pbkdf2Native: Boolean by lazy {
+        pbkdf2Factory.provider.name == "AndroidOpenSSL"
+    }
+
+    // The clone()-based PBKDF2 below needs a cloneable SHA-512; probe once.
+    private val sha512Cloneable: Boolean by lazy {
+        try {
+            MessageDigest.getInstance("SHA-512").clone()
+            true
+        } catch (_: CloneNotSupportedException) {
+            false
+        }
+    }
+
+    /**
+     * Compute one PBKDF2-HMAC-SHA512 output block (1-based index) with
+     * precomputed ipad/opad digest states.
+     *
+     * A stock HMAC re-absorbs the 128-byte padded key block twice per
+     * call; absorbing ipad/opad once and cloning those states per
+     * iteration halves the SHA-512 block compressions across the 2048
+     * rounds. Builds its own digest state, so blocks can run in parallel.
+     */
+    private fun pbkdf2Block(password: ByteArray, salt: ByteArray, iterations: Int, block: Int): ByteArray {
+        val blockSize = 128
+        val hLen = 64
+
+        var key = password
+        if (key.size > blockSize) key = MessageDigest.getInstance("SHA-512").digest(key)
+        val ipad = ByteArray(blockSize) { i -> ((if (i < key.size) key[i].toInt() else 0) xor 0x36).toByte() }
+        val opad = ByteArray(blockSize) { i -> ((if (i < key.size) key[i].toInt() else 0) xor 0x5c).toByte() }
+
+        val ipadDigest = MessageDigest.getInstance("SHA-512").apply { update(ipad) }
+        val opadDigest = MessageDigest.getInstance("SHA-512").apply { update(opad) }
+
+        fun hmac(data: ByteArray, extra: ByteArray? = null): ByteArray {
+            val inner = ipadDigest.clone() as MessageDigest
+            inner.update(data)
+            if (extra != null) inner.update(extra)
+            val outer = opadDigest.clone() as MessageDigest
+            outer.update(inner.digest())
+            return outer.digest()
+        }
+
+        val blockIndex = byteArrayOf(
+            (block ushr 24).toByte(), (block ushr 16).toByte(),
+            (block ushr 8).toByte(), block.toByte()
+        )
+        var u = hmac(salt, blockIndex)
+        val t = u.copyOf()
+        for (iter in 2..iterations) {
+            u = hmac(u)
+            for (j in 0 until hLen) t[j] = (t[j].toInt() xor u[j].toInt()).toByte()
+        }
+        return t
+    }
+
+    /** PBKDF2-HMAC-SHA512, blocks computed sequentially. */
+    private fun pbkdf2HmacSha512(password: ByteArray, salt: ByteArray, iterations: Int, dkLen: Int): ByteArray {
+        val hLen = 64
+        val n = (dkLen + hLen - 1) / hLen
+        val out = ByteArray(n * hLen)
+        for (block in 1..n) {
+            pbkdf2Block(password, salt, iterations, block).copyInto(out, (block - 1) * hLen)
+        }
+        return if (out.size == dkLen) out else out.copyOf(dkLen)
+    }
+
+    /**
+     * PBKDF2-HMAC-SHA512 with output blocks computed in parallel across
+     * Dispatchers.Default - the blocks are independent by construction.
+     * The 64-byte BIP39 seed is a single block, so today this matches the
+     * sequential path; it exists for future longer password-derived
+     * outputs (multi-key vaults and the like).
+     */
+    suspend fun pbkdf2Parallel(password: ByteArray, salt: ByteArray, iterations: Int, dkLen: Int): ByteArray = coroutineScope {
+        val hLen = 64
+        val n = (dkLen + hLen - 1) / hLen
+        val out = ByteArray(n * hLen)
+        (1..n).map { block ->
+            async(Dispatchers.Default) {
+                pbkdf2Block(password, salt, iterations, block).copyInto(out, (block - 1) * hLen)
+            }
+        }.awaitAll()
+        if (out.size == dkLen) out else out.copyOf(dkLen)
+    }
+
     /**
      * Generate a new 12-word mnemonic using SecureRandom.
      */
@@ -21,7 +127,7 @@ object BIP39 {
         // 128 bits of entropy for 12 words
         val entropy = ByteArray(16)
         secureRandom.nextBytes(entropy)
-        return entropyToMnemonic(entropy)
+        return entropyToMnemonic(entropy, 12)
     }
 
     /**
@@ -31,42 +137,96 @@ object BIP39 {
         // 256 bits of entropy for 24 words
         val entropy = ByteArray(32)
         secureRandom.nextBytes(entropy)
-        return entropyToMnemonic(entropy)
+        return entropyToMnemonic(entropy, 24)
     }
 
     /**
      * Convert entropy bytes to mnemonic words.
+     *
+     * Extracts each 11-bit word index directly with shifts and masks
+     * instead of building a binary string and parsing substrings. Only
+     * two shapes are legal (16 bytes → 12 words, 32 bytes → 24 words),
+     * so the word count comes in as a compile-time constant from the two
+     * call sites rather than being derived at runtime.
      */
-    private fun entropyToMnemonic(entropy: ByteArray): String {
+    private fun entropyToMnemonic(entropy: ByteArray, wordCount: Int): String {
         val hash = MessageDigest.getInstance("SHA-256").digest(entropy)
-        val checksumBits = entropy.size / 4 // 4 bits for 128-bit entropy, 8 for 256-bit
 
-        // Combine entropy + checksum bits
-        val bits = StringBuilder()
-        for (b in entropy) {
-            bits.append(String.format("%8s", Integer.toBinaryString(b.toInt() and 0xFF)).replace(' ', '0'))
+        // entropy || checksum byte - both legal checksum sizes fit in hash[0]
+        val combined = ByteArray(entropy.size + 1)
+        entropy.copyInto(combined)
+        combined[entropy.size] = hash[0]
+
+        val sb = StringBuilder(wordCount * 9)
+        for (i in 0 until wordCount) {
+            val off = i * 11
+            val bi = off ushr 3
+            val br = off and 7
+            var acc = ((combined[bi].toInt() and 0xFF) shl 16) or
+                ((combined[bi + 1].toInt() and 0xFF) shl 8)
+            if (bi + 2 < combined.size) acc = acc or (combined[bi + 2].toInt() and 0xFF)
+            val index = (acc ushr (13 - br)) and 0x7FF
+            if (i > 0) sb.append(' ')
+            sb.append(BIP39WordList.getWord(index))
         }
-        for (i in 0 until checksumBits) {
-            bits.append(if ((hash[0].toInt() and (1 shl (7 - i))) != 0) '1' else '0')
+        return sb.toString()
+    }
+
+    /** Result of one normalize+split+lookup pass over a mnemonic. */
+    internal class MnemonicDecoded(val normalized: String, val indices: IntArray)
+
+    /**
+     * Normalize, split and resolve word indices in a single pass.
+     * Returns null when the length or any word is invalid.
+     */
+    internal fun decode(mnemonic: String): MnemonicDecoded? {
+        val normalized = mnemonic.normalizeMnemonic()
+        val words = normalized.split(" ")
+        if (words.size != 12 && words.size != 24) return null
+        val indices = IntArray(words.size)
+        for (i in words.indices) {
+            val idx = BIP39WordList.indexOf(words[i])
+            if (idx < 0) return null
+            indices[i] = idx
         }
+        return MnemonicDecoded(normalized, indices)
+    }
 
-        // Split into 11-bit chunks and map to words
-        val words = mutableListOf<String>()
-        for (i in 0 until bits.length / 11) {
-            val index = bits.substring(i * 11, (i + 1) * 11).toInt(2)
-            words.add(BIP39WordList.getWord(index))
+    /**
+     * Verify the BIP-39 checksum by repacking the 11-bit indices into
+     * entropy bytes and comparing the trailing bits against SHA-256 of
+     * the recovered entropy.
+     */
+    private fun checksumValid(indices: IntArray): Boolean {
+        val entropyBits = indices.size * 11 * 32 / 33
+        val checksumBits = entropyBits / 32
+        val entropy = ByteArray(entropyBits / 8)
+
+        var acc = 0
+        var accBits = 0
+        var out = 0
+        for (idx in indices) {
+            acc = (acc shl 11) or idx
+            accBits += 11
+            while (accBits >= 8 && out < entropy.size) {
+                accBits -= 8
+                entropy[out++] = ((acc ushr accBits) and 0xFF).toByte()
+            }
         }
+        // Exactly checksumBits bits remain in the accumulator here.
+        val actual = acc and ((1 shl checksumBits) - 1)
 
-        return words.joinToString(" ")
+        val hash = MessageDigest.getInstance("SHA-256").digest(entropy)
+        val expected = (hash[0].toInt() and 0xFF) ushr (8 - checksumBits)
+        return actual == expected
     }
 
     /**
-     * Validate mnemonic phrase.
+     * Validate mnemonic phrase, including the checksum bits.
      */
     fun validateMnemonic(mnemonic: String): Boolean {
-        val words = mnemonic.normalizeMnemonic().split(" ")
-        if (words.size != 12 && words.size != 24) return false
-        return words.all { BIP39WordList.isValidWord(it) }
+        val decoded = decode(mnemonic) ?: return false
+        return checksumValid(decoded.indices)
     }
 
     /**
@@ -74,16 +234,24 @@ object BIP39 {
      * Salt = "mnemonic", iterations = 2048
      */
     fun seedFromMnemonic(mnemonic: String): ByteArray {
-        if (!validateMnemonic(mnemonic)) {
+        val decoded = decode(mnemonic) ?: throw InvalidMnemonicException()
+        if (!checksumValid(decoded.indices)) {
             throw InvalidMnemonicException()
         }
 
-        val normalized = mnemonic.normalizeMnemonic()
-        val password = normalized.toCharArray()
-        val salt = Constants.BIP39_SALT.toByteArray(Charsets.UTF_8)
+        // Prefer native libcrypto PBKDF2 when the platform actually ships
+        // it; a hardware-SHA512 loop in C beats any managed variant.
+        if (!pbkdf2Native && sha512Cloneable) {
+            return pbkdf2HmacSha512(
+                decoded.normalized.toByteArray(Charsets.UTF_8),
+                CryptoBytes.BIP39_SALT,
+                Constants.BIP39_ITERATIONS,
+                Constants.BIP39_SEED_LENGTH
+            )
+        }
 
-        val spec = PBEKeySpec(password, salt, Constants.BIP39_ITERATIONS, Constants.BIP39_SEED_LENGTH * 8)
-        val factory = SecretKeyFactory.getInstance("PBKDF2WithHmacSHA512")
-        return factory.generateSecret(spec).encoded
+        val password = decoded.normalized.toCharArray()
+        val spec = PBEKeySpec(password, CryptoBytes.BIP39_SALT, Constants.BIP39_ITERATIONS, Constants.BIP39_SEED_LENGTH * 8)
+        return pbkdf2Factory.generateSecret(spec).encoded
     }
 }
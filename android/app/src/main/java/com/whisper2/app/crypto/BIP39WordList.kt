@@ -2,7 +2,7 @@ package com.whisper2.app.crypto
 
 /** BIP39 English wordlist (2048 words) */
 object BIP39WordList {
-    val words: List<String> = listOf(
+    val words: Array<String> = arrayOf(
         "abandon", "ability", "able", "about", "above", "absent", "absorb", "abstract", "absurd", "abuse",
         "access", "accident", "account", "accuse", "achieve", "acid", "acoustic", "acquire", "across", "act",
         "action", "actor", "actress", "actual", "adapt", "add", "addict", "address", "adjust", "admit",
@@ -210,9 +210,38 @@ object BIP39WordList {
         "yellow", "you", "young", "youth", "zebra", "zero", "zone", "zoo"
     )
 
+    // Initial capacity 2731 = 2048/0.75 so the map never rehashes.
+    private val indexMap: HashMap<String, Int> = HashMap<String, Int>(2731).also { m ->
+        words.forEachIndexed { i, w -> m[w] = i }
+    }
+
+    /**
+     * Lowercase with an ASCII fast path: already-lowercase input (the
+     * common case after normalization) comes back without allocating,
+     * and non-ASCII falls through to the locale-aware lowercase().
+     */
+    private fun asciiLower(s: String): String {
+        var needs = false
+        for (i in s.indices) {
+            val c = s[i]
+            if (c.code > 127) return s.lowercase()
+            if (c in 'A'..'Z') {
+                needs = true
+                break
+            }
+        }
+        if (!needs) return s
+        val chars = CharArray(s.length)
+        for (i in s.indices) {
+            val c = s[i]
+            chars[i] = if (c in 'A'..'Z') (c.code + 32).toChar() else c
+        }
+        return String(chars)
+    }
+
     fun getWord(index: Int): String = words[index]
 
-    fun isValidWord(word: String): Boolean = words.contains(word.lowercase())
+    fun isValidWord(word: String): Boolean = indexMap.containsKey(asciiLower(word))
 
-    fun indexOf(word: String): Int = words.indexOf(word.lowercase())
+    fun indexOf(word: String): Int = indexMap[asciiLower(word)] ?: -1
 }
@@ -1,6 +1,8 @@
 package com.whisper2.app.crypto
 
-import com.whisper2.app.core.encodeBase64
+import android.util.Base64
+import android.util.Base64OutputStream
+import java.io.OutputStream
 import java.security.MessageDigest
 import javax.inject.Inject
 import javax.inject.Singleton
@@ -22,6 +24,51 @@ import javax.inject.Singleton
 class CanonicalSigning @Inject constructor(
     private val signatures: Signatures
 ) {
+    // One digest per thread; getInstance walks the JCA provider list and
+    // allocates on every call otherwise.
+    private val sha256 = ThreadLocal.withInitial { MessageDigest.getInstance("SHA-256") }
+
+    companion object {
+        private val V1 = "v1\n".toByteArray(Charsets.UTF_8)
+        private val NL = byteArrayOf(0x0A)
+    }
+
+    /** Feeds every written byte straight into the wrapped digest. */
+    private class DigestSink(private val md: MessageDigest) : OutputStream() {
+        override fun write(b: Int) = md.update(b.toByte())
+        override fun write(b: ByteArray, off: Int, len: Int) = md.update(b, off, len)
+    }
+
+    /**
+     * Hash the canonical form by streaming UTF-8 bytes into the digest.
+     * The assembled canonical string never materializes; Base64.encode
+     * returns byte arrays directly, so no encoded Strings are allocated
+     * either.
+     */
+    private fun canonicalHash(
+        messageType: String,
+        messageId: String,
+        from: String,
+        toOrGroupId: String,
+        timestamp: Long,
+        nonce: ByteArray,
+        ciphertext: ByteArray
+    ): ByteArray {
+        val md = sha256.get()!!.apply { reset() }
+        md.update(V1)
+        md.update(messageType.toByteArray(Charsets.UTF_8)); md.update(NL)
+        md.update(messageId.toByteArray(Charsets.UTF_8)); md.update(NL)
+        md.update(from.toByteArray(Charsets.UTF_8)); md.update(NL)
+        md.update(toOrGroupId.toByteArray(Charsets.UTF_8)); md.update(NL)
+        md.update(timestamp.toString().toByteArray(Charsets.UTF_8)); md.update(NL)
+        md.update(Base64.encode(nonce, Base64.NO_WRAP)); md.update(NL)
+        // Ciphertexts can be attachment-sized; stream the Base64 form into
+        // the digest so the encoded bytes never materialize in full.
+        Base64OutputStream(DigestSink(md), Base64.NO_WRAP or Base64.NO_CLOSE).use { it.write(ciphertext) }
+        md.update(NL)
+        return md.digest()
+    }
+
     /**
      * Sign a message using canonical format.
      */
@@ -35,20 +82,7 @@ class CanonicalSigning @Inject constructor(
         ciphertext: ByteArray,
         privateKey: ByteArray
     ): ByteArray {
-        val canonical = buildString {
-            append("v1\n")
-            append("$messageType\n")
-            append("$messageId\n")
-            append("$from\n")
-            append("$toOrGroupId\n")
-            append("$timestamp\n")
-            append("${nonce.encodeBase64()}\n")
-            append("${ciphertext.encodeBase64()}\n")
-        }
-
-        val hash = MessageDigest.getInstance("SHA-256")
-            .digest(canonical.toByteArray(Charsets.UTF_8))
-
+        val hash = canonicalHash(messageType, messageId, from, toOrGroupId, timestamp, nonce, ciphertext)
         return signatures.sign(hash, privateKey)
     }
 
@@ -66,20 +100,7 @@ class CanonicalSigning @Inject constructor(
         signature: ByteArray,
         publicKey: ByteArray
     ): Boolean {
-        val canonical = buildString {
-            append("v1\n")
-            append("$messageType\n")
-            append("$messageId\n")
-            append("$from\n")
-            append("$toOrGroupId\n")
-            append("$timestamp\n")
-            append("${nonce.encodeBase64()}\n")
-            append("${ciphertext.encodeBase64()}\n")
-        }
-
-        val hash = MessageDigest.getInstance("SHA-256")
-            .digest(canonical.toByteArray(Charsets.UTF_8))
-
+        val hash = canonicalHash(messageType, messageId, from, toOrGroupId, timestamp, nonce, ciphertext)
         return signatures.verify(hash, signature, publicKey)
     }
 }
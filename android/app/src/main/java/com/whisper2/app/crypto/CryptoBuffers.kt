@@ -0,0 +1,36 @@
+package com.whisper2.app.crypto
+
+/**
+ * Per-thread scratch buffers for the NaCl seal/open paths.
+ * The libsodium binding only accepts whole arrays, so offset writes go
+ * through a reusable buffer instead of allocating per call.
+ */
+internal object CryptoBuffers {
+
+    private val scratch = ThreadLocal.withInitial { ByteArray(0) }
+    private val scratchIn = ThreadLocal.withInitial { ByteArray(0) }
+
+    /** Returns this thread's output scratch buffer, grown to at least [min] bytes. */
+    fun scratch(min: Int): ByteArray {
+        var buf = scratch.get()!!
+        if (buf.size < min) {
+            buf = ByteArray(min)
+            scratch.set(buf)
+        }
+        return buf
+    }
+
+    /**
+     * Returns this thread's input scratch buffer, grown to at least [min]
+     * bytes. Separate from [scratch] so a chunked seal can stage its
+     * plaintext slice and ciphertext at the same time.
+     */
+    fun scratchIn(min: Int): ByteArray {
+        var buf = scratchIn.get()!!
+        if (buf.size < min) {
+            buf = ByteArray(min)
+            scratchIn.set(buf)
+        }
+        return buf
+    }
+}
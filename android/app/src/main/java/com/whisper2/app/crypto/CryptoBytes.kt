@@ -0,0 +1,16 @@
+package com.whisper2.app.crypto
+
+import com.whisper2.app.core.Constants
+
+/**
+ * UTF-8 encodings of the frozen protocol strings, computed once.
+ * The string constants in [Constants] stay authoritative; every crypto
+ * call site takes the bytes from here instead of re-encoding per call.
+ */
+object CryptoBytes {
+    val BIP39_SALT = Constants.BIP39_SALT.toByteArray(Charsets.UTF_8)
+    val HKDF_SALT = Constants.HKDF_SALT.toByteArray(Charsets.UTF_8)
+    val ENC_INFO = Constants.ENCRYPTION_DOMAIN.toByteArray(Charsets.UTF_8)
+    val SIGN_INFO = Constants.SIGNING_DOMAIN.toByteArray(Charsets.UTF_8)
+    val CONTACTS_INFO = Constants.CONTACTS_DOMAIN.toByteArray(Charsets.UTF_8)
+}
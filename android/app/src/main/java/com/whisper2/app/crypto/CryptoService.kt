@@ -18,10 +18,10 @@ class CryptoService @Inject constructor(
     private val naclBox: NaClBox,
     private val naclSecretBox: NaClSecretBox,
     private val signatures: Signatures,
-    private val canonicalSigning: CanonicalSigning
+    private val canonicalSigning: CanonicalSigning,
+    private val secureRandom: SecureRandom
 ) {
     private val keyDerivation = KeyDerivation(lazySodium)
-    private val secureRandom = SecureRandom()
 
     companion object {
         // Base32 alphabet (matches server exactly)
@@ -31,8 +31,8 @@ class CryptoService @Inject constructor(
     fun generateMnemonic(): String = BIP39.generateMnemonic(secureRandom)
     fun generateMnemonic24(): String = BIP39.generateMnemonic24(secureRandom)
     fun validateMnemonic(mnemonic: String): Boolean = BIP39.validateMnemonic(mnemonic)
-    fun deriveAllKeys(mnemonic: String) = keyDerivation.deriveAllKeys(mnemonic)
-    fun deriveKeys(mnemonic: String) = keyDerivation.deriveAllKeys(mnemonic)
+    suspend fun deriveAllKeys(mnemonic: String) = keyDerivation.deriveAllKeys(mnemonic)
+    suspend fun deriveKeys(mnemonic: String) = keyDerivation.deriveAllKeys(mnemonic)
     fun generateNonce() = nonceGenerator.generateNonce()
     fun generateKey() = nonceGenerator.generateKey()
 
@@ -162,12 +162,18 @@ class CryptoService @Inject constructor(
     fun boxSeal(message: ByteArray, nonce: ByteArray, recipientPubKey: ByteArray, senderPrivKey: ByteArray) =
         naclBox.seal(message, nonce, recipientPubKey, senderPrivKey)
 
+    fun boxSealInto(dst: ByteArray, off: Int, message: ByteArray, nonce: ByteArray, recipientPubKey: ByteArray, senderPrivKey: ByteArray) =
+        naclBox.sealInto(dst, off, message, nonce, recipientPubKey, senderPrivKey)
+
     fun boxOpen(ciphertext: ByteArray, nonce: ByteArray, senderPubKey: ByteArray, recipientPrivKey: ByteArray) =
         naclBox.open(ciphertext, nonce, senderPubKey, recipientPrivKey)
 
     fun secretBoxSeal(message: ByteArray, nonce: ByteArray, key: ByteArray) =
         naclSecretBox.seal(message, nonce, key)
 
+    fun secretBoxSealInto(dst: ByteArray, off: Int, message: ByteArray, nonce: ByteArray, key: ByteArray) =
+        naclSecretBox.sealInto(dst, off, message, nonce, key)
+
     fun secretBoxOpen(ciphertext: ByteArray, nonce: ByteArray, key: ByteArray) =
         naclSecretBox.open(ciphertext, nonce, key)
 
@@ -12,11 +12,16 @@ object HKDF {
 
     private const val HASH_LEN = 32 // SHA-256 output
 
+    // One Mac per thread; Mac.getInstance resolves a JCA provider service
+    // and synthesizes a wrapper on every call. Each entry point re-inits
+    // the Mac with its own key, so calls are not reentrant on one thread.
+    private val hmac: ThreadLocal<Mac> = ThreadLocal.withInitial { Mac.getInstance("HmacSHA256") }
+
     /**
      * HKDF-Extract: Extract a pseudorandom key from input keying material.
      */
     fun extract(salt: ByteArray, ikm: ByteArray): ByteArray {
-        val mac = Mac.getInstance("HmacSHA256")
+        val mac = hmac.get()!!
         mac.init(SecretKeySpec(salt, "HmacSHA256"))
         return mac.doFinal(ikm)
     }
@@ -25,23 +30,23 @@ object HKDF {
      * HKDF-Expand: Expand the pseudorandom key to desired length.
      */
     fun expand(prk: ByteArray, info: ByteArray, length: Int): ByteArray {
-        val mac = Mac.getInstance("HmacSHA256")
+        val mac = hmac.get()!!
         mac.init(SecretKeySpec(prk, "HmacSHA256"))
 
         val n = ceil(length.toDouble() / HASH_LEN).toInt()
         val okm = ByteArray(n * HASH_LEN)
-        var t = ByteArray(0)
 
+        // Each round finalizes straight into okm; the previous block is
+        // chained by reading it back out of okm, so no per-round T buffer.
         for (i in 1..n) {
             mac.reset()
-            mac.update(t)
+            if (i > 1) mac.update(okm, (i - 2) * HASH_LEN, HASH_LEN)
             mac.update(info)
             mac.update(i.toByte())
-            t = mac.doFinal()
-            System.arraycopy(t, 0, okm, (i - 1) * HASH_LEN, HASH_LEN)
+            mac.doFinal(okm, (i - 1) * HASH_LEN)
         }
 
-        return okm.copyOf(length)
+        return if (okm.size == length) okm else okm.copyOf(length)
     }
 
     /**
@@ -51,4 +56,43 @@ object HKDF {
         val prk = extract(salt, ikm)
         return expand(prk, info, length)
     }
+
+    /**
+     * Derive several keys of the same length from one IKM, one per info.
+     *
+     * Extracts the PRK once and keys a single Mac with it, so the HMAC key
+     * schedule and provider lookup happen once instead of per domain. Each
+     * expand round writes straight into the output array via
+     * doFinal(output, offset) with no intermediate block buffer.
+     */
+    fun deriveMany(ikm: ByteArray, salt: ByteArray, infos: List<ByteArray>, length: Int): List<ByteArray> {
+        val prk = extract(salt, ikm)
+        val mac = hmac.get()!!
+        mac.init(SecretKeySpec(prk, "HmacSHA256"))
+
+        // Single-block outputs (the common 32-byte case) skip the
+        // chaining loop entirely: one update+finalize per domain.
+        if (length == HASH_LEN) {
+            return infos.map { info ->
+                mac.reset()
+                mac.update(info)
+                mac.update(1.toByte())
+                mac.doFinal()
+            }
+        }
+
+        val n = ceil(length.toDouble() / HASH_LEN).toInt()
+        return infos.map { info ->
+            val okm = ByteArray(n * HASH_LEN)
+            for (i in 1..n) {
+                mac.reset()
+                // First round has no previous block to chain.
+                if (i > 1) mac.update(okm, (i - 2) * HASH_LEN, HASH_LEN)
+                mac.update(info)
+                mac.update(i.toByte())
+                mac.doFinal(okm, (i - 1) * HASH_LEN)
+            }
+            if (okm.size == length) okm else okm.copyOf(length)
+        }
+    }
 }
@@ -3,7 +3,12 @@ package com.whisper2.app.crypto
 import com.goterl.lazysodium.LazySodiumAndroid
 import com.goterl.lazysodium.interfaces.Box
 import com.goterl.lazysodium.interfaces.Sign
-import com.whisper2.app.core.Constants
+import com.whisper2.app.core.KeyDerivationException
+import java.security.MessageDigest
+import kotlinx.coroutines.Dispatchers
+import kotlinx.coroutines.async
+import kotlinx.coroutines.coroutineScope
+import kotlinx.coroutines.withContext
 
 /**
  * Key derivation from BIP39 seed.
@@ -17,56 +22,105 @@ import com.whisper2.app.core.Constants
  */
 class KeyDerivation(private val lazySodium: LazySodiumAndroid) {
 
-    data class DerivedKeys(
-        val encPublicKey: ByteArray,
-        val encPrivateKey: ByteArray,
-        val signPublicKey: ByteArray,
-        val signPrivateKey: ByteArray,
-        val contactsKey: ByteArray
-    )
+    // Fast-KDF candidate: libsodium's native BLAKE2b (keyed generichash)
+    // in place of HKDF-SHA256 - one SIMD native call per domain instead
+    // of the extract/expand HMAC pair. Protocol-breaking: the same
+    // mnemonic derives different keys, so this stays off until server and
+    // iOS negotiate a CRYPTO_VERSION that includes it.
+    private val useBlake2bKdf = false
+
+    /**
+     * All derived key material in one contiguous buffer, so logout / key
+     * rotation can zero everything with a single [wipe] instead of five
+     * separate fills. The property getters return defensive copies; the
+     * layout is enc pub | enc priv | sign pub | sign priv | contacts key.
+     */
+    class DerivedKeys(private val buf: ByteArray) {
+        val encPublicKey: ByteArray get() = buf.copyOfRange(ENC_PUB, ENC_PRIV)
+        val encPrivateKey: ByteArray get() = buf.copyOfRange(ENC_PRIV, SIGN_PUB)
+        val signPublicKey: ByteArray get() = buf.copyOfRange(SIGN_PUB, SIGN_PRIV)
+        val signPrivateKey: ByteArray get() = buf.copyOfRange(SIGN_PRIV, CONTACTS)
+        val contactsKey: ByteArray get() = buf.copyOfRange(CONTACTS, SIZE)
+
+        /** Zero the backing buffer. Getters return all-zero keys afterwards. */
+        fun wipe() {
+            java.util.Arrays.fill(buf, 0.toByte())
+        }
+
+        // Constant-time comparison; a data-class equals would short-circuit
+        // on the first differing byte.
+        override fun equals(other: Any?): Boolean {
+            if (this === other) return true
+            if (other !is DerivedKeys) return false
+            return MessageDigest.isEqual(buf, other.buf)
+        }
+
+        override fun hashCode(): Int = buf.size
+
+        companion object {
+            const val ENC_PUB = 0
+            const val ENC_PRIV = 32
+            const val SIGN_PUB = 64
+            const val SIGN_PRIV = 96 // Ed25519 private key is 64 bytes
+            const val CONTACTS = 160
+            const val SIZE = 192
+        }
+    }
 
     /**
      * Derive all keys from mnemonic.
+     *
+     * Runs the PBKDF2 step off the caller's thread, then derives the
+     * three independent domain branches in parallel - each expansion
+     * gets its own per-thread Mac via HKDF.
      */
-    fun deriveAllKeys(mnemonic: String): DerivedKeys {
+    suspend fun deriveAllKeys(mnemonic: String): DerivedKeys {
         // Step 1: Mnemonic → BIP39 Seed (PBKDF2)
-        val seed = BIP39.seedFromMnemonic(mnemonic)
-
-        // Step 2: HKDF to derive domain-specific seeds
-        val salt = Constants.HKDF_SALT.toByteArray(Charsets.UTF_8)
-
-        val encSeed = HKDF.deriveKey(
-            ikm = seed,
-            salt = salt,
-            info = Constants.ENCRYPTION_DOMAIN.toByteArray(Charsets.UTF_8),
-            length = 32
-        )
-
-        val signSeed = HKDF.deriveKey(
-            ikm = seed,
-            salt = salt,
-            info = Constants.SIGNING_DOMAIN.toByteArray(Charsets.UTF_8),
-            length = 32
-        )
-
-        val contactsKey = HKDF.deriveKey(
-            ikm = seed,
-            salt = salt,
-            info = Constants.CONTACTS_DOMAIN.toByteArray(Charsets.UTF_8),
-            length = 32
-        )
-
-        // Step 3: Generate keypairs from seeds
-        val encKeyPair = generateEncryptionKeyPair(encSeed)
-        val signKeyPair = generateSigningKeyPair(signSeed)
-
-        return DerivedKeys(
-            encPublicKey = encKeyPair.first,
-            encPrivateKey = encKeyPair.second,
-            signPublicKey = signKeyPair.first,
-            signPrivateKey = signKeyPair.second,
-            contactsKey = contactsKey
-        )
+        val seed = withContext(Dispatchers.Default) { BIP39.seedFromMnemonic(mnemonic) }
+
+        // Step 2: extract once, then expand + keypair per domain in parallel
+        val expand: (ByteArray) -> ByteArray = if (useBlake2bKdf) {
+            { info -> deriveKeyBlake2b(seed, info, 32) }
+        } else {
+            val prk = HKDF.extract(CryptoBytes.HKDF_SALT, seed)
+            ({ info -> HKDF.expand(prk, info, 32) })
+        }
+        return coroutineScope {
+            val enc = async(Dispatchers.Default) {
+                generateEncryptionKeyPair(expand(CryptoBytes.ENC_INFO))
+            }
+            val sign = async(Dispatchers.Default) {
+                generateSigningKeyPair(expand(CryptoBytes.SIGN_INFO))
+            }
+            val contacts = async(Dispatchers.Default) {
+                expand(CryptoBytes.CONTACTS_INFO)
+            }
+
+            val encKeyPair = enc.await()
+            val signKeyPair = sign.await()
+
+            // One pooled allocation; the libsodium binding needs whole
+            // arrays, so the keypairs are generated then packed.
+            val buf = ByteArray(DerivedKeys.SIZE)
+            encKeyPair.first.copyInto(buf, DerivedKeys.ENC_PUB)
+            encKeyPair.second.copyInto(buf, DerivedKeys.ENC_PRIV)
+            signKeyPair.first.copyInto(buf, DerivedKeys.SIGN_PUB)
+            signKeyPair.second.copyInto(buf, DerivedKeys.SIGN_PRIV)
+            contacts.await().copyInto(buf, DerivedKeys.CONTACTS)
+            DerivedKeys(buf)
+        }
+    }
+
+    /**
+     * BLAKE2b domain KDF via libsodium generichash:
+     * out = BLAKE2b(key = seed, message = info).
+     */
+    private fun deriveKeyBlake2b(seed: ByteArray, info: ByteArray, length: Int): ByteArray {
+        val out = ByteArray(length)
+        if (!lazySodium.cryptoGenericHash(out, length, info, info.size.toLong(), seed, seed.size)) {
+            throw KeyDerivationException("BLAKE2b KDF failed")
+        }
+        return out
     }
 
     /**
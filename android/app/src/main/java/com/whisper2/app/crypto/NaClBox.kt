@@ -43,6 +43,40 @@ class NaClBox @Inject constructor(
         return ciphertext
     }
 
+    /**
+     * Encrypt into a caller-owned buffer at [off]; returns bytes written.
+     *
+     * Lets group fan-out reuse one wire buffer instead of allocating a
+     * fresh ciphertext per recipient. The libsodium binding takes whole
+     * arrays, so offset destinations go through a per-thread scratch
+     * buffer that grows to the largest message seen.
+     */
+    fun sealInto(
+        dst: ByteArray,
+        off: Int,
+        message: ByteArray,
+        nonce: ByteArray,
+        recipientPublicKey: ByteArray,
+        senderPrivateKey: ByteArray
+    ): Int {
+        val len = message.size + Box.MACBYTES
+        require(off >= 0 && off + len <= dst.size) { "Destination too small" }
+
+        if (off == 0 && dst.size == len) {
+            if (!lazySodium.cryptoBoxEasy(dst, message, message.size.toLong(), nonce, recipientPublicKey, senderPrivateKey)) {
+                throw EncryptionException("NaCl box seal failed")
+            }
+            return len
+        }
+
+        val buf = CryptoBuffers.scratch(len)
+        if (!lazySodium.cryptoBoxEasy(buf, message, message.size.toLong(), nonce, recipientPublicKey, senderPrivateKey)) {
+            throw EncryptionException("NaCl box seal failed")
+        }
+        System.arraycopy(buf, 0, dst, off, len)
+        return len
+    }
+
     /**
      * Decrypt message from sender using recipient's private key.
      */
@@ -36,6 +36,73 @@ class NaClSecretBox @Inject constructor(
         return ciphertext
     }
 
+    /**
+     * Encrypt into a caller-owned buffer at [off]; returns bytes written.
+     *
+     * Streamed attachment chunks reuse one output buffer instead of
+     * allocating per chunk; offset destinations go through a per-thread
+     * scratch buffer since the libsodium binding takes whole arrays.
+     */
+    fun sealInto(dst: ByteArray, off: Int, message: ByteArray, nonce: ByteArray, key: ByteArray): Int {
+        val len = message.size + SecretBox.MACBYTES
+        require(off >= 0 && off + len <= dst.size) { "Destination too small" }
+
+        if (off == 0 && dst.size == len) {
+            if (!lazySodium.cryptoSecretBoxEasy(dst, message, message.size.toLong(), nonce, key)) {
+                throw EncryptionException("SecretBox seal failed")
+            }
+            return len
+        }
+
+        val buf = CryptoBuffers.scratch(len)
+        if (!lazySodium.cryptoSecretBoxEasy(buf, message, message.size.toLong(), nonce, key)) {
+            throw EncryptionException("SecretBox seal failed")
+        }
+        System.arraycopy(buf, 0, dst, off, len)
+        return len
+    }
+
+    /**
+     * Encrypt a slice of [message] into [out] at [offOut]; returns bytes
+     * written. Streamed attachment uploads call this once per chunk with
+     * reused buffers, so steady-state encryption allocates nothing - the
+     * binding takes whole arrays, so offset slices are staged through the
+     * per-thread scratch buffers.
+     */
+    fun sealChunk(
+        message: ByteArray,
+        offM: Int,
+        lenM: Int,
+        nonce: ByteArray,
+        key: ByteArray,
+        out: ByteArray,
+        offOut: Int
+    ): Int {
+        val len = lenM + SecretBox.MACBYTES
+        require(offM >= 0 && lenM >= 0 && offM + lenM <= message.size) { "Source range out of bounds" }
+        require(offOut >= 0 && offOut + len <= out.size) { "Destination too small" }
+
+        var plain = message
+        if (offM != 0) {
+            plain = CryptoBuffers.scratchIn(lenM)
+            System.arraycopy(message, offM, plain, 0, lenM)
+        }
+
+        if (offOut == 0) {
+            if (!lazySodium.cryptoSecretBoxEasy(out, plain, lenM.toLong(), nonce, key)) {
+                throw EncryptionException("SecretBox seal failed")
+            }
+            return len
+        }
+
+        val buf = CryptoBuffers.scratch(len)
+        if (!lazySodium.cryptoSecretBoxEasy(buf, plain, lenM.toLong(), nonce, key)) {
+            throw EncryptionException("SecretBox seal failed")
+        }
+        System.arraycopy(buf, 0, out, offOut, len)
+        return len
+    }
+
     /**
      * Decrypt data with symmetric key.
      */
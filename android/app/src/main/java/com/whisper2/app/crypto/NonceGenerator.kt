@@ -15,6 +15,13 @@ class NonceGenerator @Inject constructor(
 ) {
     /**
      * Generate 24-byte nonce for XSalsa20-Poly1305.
+     *
+     * Always returns a fresh array. A ThreadLocal buffer pool was
+     * evaluated and rejected: every caller encrypts inside suspend
+     * functions, where a resumed coroutine can land on another thread or
+     * interleave with a second sender on the same one - aliasing a
+     * pooled buffer between two messages would be NaCl nonce reuse, not
+     * an optimization. 24 B per send is young-gen noise.
      */
     fun generateNonce(): ByteArray {
         val nonce = ByteArray(Constants.NACL_NONCE_SIZE)
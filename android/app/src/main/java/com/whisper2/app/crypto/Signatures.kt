@@ -6,6 +6,10 @@ import com.whisper2.app.core.SignatureVerificationException
 import java.security.MessageDigest
 import javax.inject.Inject
 import javax.inject.Singleton
+import kotlinx.coroutines.Dispatchers
+import kotlinx.coroutines.async
+import kotlinx.coroutines.awaitAll
+import kotlinx.coroutines.coroutineScope
 
 /**
  * Ed25519 signatures.
@@ -15,6 +19,15 @@ import javax.inject.Singleton
 class Signatures @Inject constructor(
     private val lazySodium: LazySodiumAndroid
 ) {
+    // One digest per thread; getInstance walks the JCA provider list and
+    // allocates on every call otherwise.
+    private val sha256 = ThreadLocal.withInitial { MessageDigest.getInstance("SHA-256") }
+
+    private fun sha256(data: ByteArray): ByteArray = sha256.get()!!.let {
+        it.reset()
+        it.digest(data)
+    }
+
     /**
      * Sign message with Ed25519 private key.
      */
@@ -31,20 +44,50 @@ class Signatures @Inject constructor(
         return lazySodium.cryptoSignVerifyDetached(signature, message, message.size, publicKey)
     }
 
+    /**
+     * Sign many messages with one key, packing all signatures into a
+     * single ByteArray(n * 64); signature i lives at offset i * 64.
+     * One output allocation instead of one per message.
+     */
+    fun signBatch(messages: List<ByteArray>, privateKey: ByteArray): ByteArray {
+        val out = ByteArray(messages.size * Sign.BYTES)
+        val sig = ByteArray(Sign.BYTES)
+        for (i in messages.indices) {
+            val message = messages[i]
+            lazySodium.cryptoSignDetached(sig, message, message.size.toLong(), privateKey)
+            sig.copyInto(out, i * Sign.BYTES)
+        }
+        return out
+    }
+
+    /**
+     * Verify (message, signature, publicKey) triples in parallel across
+     * Dispatchers.Default - inbox backfill verifies on all cores instead
+     * of serially on the caller's thread.
+     */
+    suspend fun verifyBatch(items: List<Triple<ByteArray, ByteArray, ByteArray>>): BooleanArray = coroutineScope {
+        val results = BooleanArray(items.size)
+        items.indices.map { i ->
+            async(Dispatchers.Default) {
+                val (message, signature, publicKey) = items[i]
+                results[i] = lazySodium.cryptoSignVerifyDetached(signature, message, message.size, publicKey)
+            }
+        }.awaitAll()
+        results
+    }
+
     /**
      * Sign challenge for authentication.
      * Server expects: Ed25519_Sign(SHA256(challengeBytes), privateKey)
      */
     fun signChallenge(challenge: ByteArray, privateKey: ByteArray): ByteArray {
-        val hash = MessageDigest.getInstance("SHA-256").digest(challenge)
-        return sign(hash, privateKey)
+        return sign(sha256(challenge), privateKey)
     }
 
     /**
      * Verify challenge signature.
      */
     fun verifyChallenge(challenge: ByteArray, signature: ByteArray, publicKey: ByteArray): Boolean {
-        val hash = MessageDigest.getInstance("SHA-256").digest(challenge)
-        return verify(hash, signature, publicKey)
+        return verify(sha256(challenge), signature, publicKey)
     }
 }
@@ -18,7 +18,7 @@ import com.whisper2.app.data.local.db.entities.*
         OutboxEntity::class,
         CallRecordEntity::class
     ],
-    version = 7,
+    version = 9,
     exportSchema = true
 )
 abstract class WhisperDatabase : RoomDatabase() {
@@ -89,5 +89,58 @@ abstract class WhisperDatabase : RoomDatabase() {
                 database.execSQL("ALTER TABLE contacts ADD COLUMN lastSeen INTEGER DEFAULT NULL")
             }
         }
+
+        // Migration from version 7 to 8: Indices for the hot query paths.
+        // Names must match Room's generated index names (index_<table>_<cols>).
+        val MIGRATION_7_8 = object : Migration(7, 8) {
+            override fun migrate(database: SupportSQLiteDatabase) {
+                database.execSQL("CREATE INDEX IF NOT EXISTS `index_messages_conversationId_timestamp` ON `messages` (`conversationId`, `timestamp`)")
+                database.execSQL("CREATE INDEX IF NOT EXISTS `index_messages_status` ON `messages` (`status`)")
+                database.execSQL("CREATE INDEX IF NOT EXISTS `index_messages_groupId` ON `messages` (`groupId`)")
+                database.execSQL("CREATE INDEX IF NOT EXISTS `index_conversations_lastMessageTimestamp` ON `conversations` (`lastMessageTimestamp`)")
+                database.execSQL("CREATE INDEX IF NOT EXISTS `index_outbox_status_createdAt` ON `outbox` (`status`, `createdAt`)")
+                database.execSQL("CREATE INDEX IF NOT EXISTS `index_group_members_groupId` ON `group_members` (`groupId`)")
+            }
+        }
+
+        // Migration from version 8 to 9: drop the five location columns.
+        // Location messages carry coordinates in their content JSON (iOS
+        // parity) and the renderer already read from there; the columns
+        // were dead weight on every row. SQLite on older devices has no
+        // DROP COLUMN, so rebuild the table.
+        val MIGRATION_8_9 = object : Migration(8, 9) {
+            override fun migrate(database: SupportSQLiteDatabase) {
+                database.execSQL("""
+                    CREATE TABLE IF NOT EXISTS `messages_new` (
+                        `id` TEXT NOT NULL, `conversationId` TEXT NOT NULL, `groupId` TEXT,
+                        `from` TEXT NOT NULL, `to` TEXT NOT NULL, `contentType` TEXT NOT NULL,
+                        `content` TEXT NOT NULL, `timestamp` INTEGER NOT NULL, `status` TEXT NOT NULL,
+                        `direction` TEXT NOT NULL, `replyTo` TEXT,
+                        `attachmentBlobId` TEXT, `attachmentKey` TEXT, `attachmentNonce` TEXT,
+                        `attachmentMimeType` TEXT, `attachmentSize` INTEGER, `attachmentFileName` TEXT,
+                        `attachmentDuration` INTEGER, `attachmentWidth` INTEGER, `attachmentHeight` INTEGER,
+                        `attachmentThumbnail` TEXT, `attachmentLocalPath` TEXT,
+                        `createdAt` INTEGER NOT NULL, `readAt` INTEGER, `expiresAt` INTEGER,
+                        PRIMARY KEY(`id`)
+                    )
+                """)
+                database.execSQL("""
+                    INSERT INTO `messages_new`
+                    SELECT `id`, `conversationId`, `groupId`, `from`, `to`, `contentType`,
+                        `content`, `timestamp`, `status`, `direction`, `replyTo`,
+                        `attachmentBlobId`, `attachmentKey`, `attachmentNonce`,
+                        `attachmentMimeType`, `attachmentSize`, `attachmentFileName`,
+                        `attachmentDuration`, `attachmentWidth`, `attachmentHeight`,
+                        `attachmentThumbnail`, `attachmentLocalPath`,
+                        `createdAt`, `readAt`, `expiresAt`
+                    FROM `messages`
+                """)
+                database.execSQL("DROP TABLE `messages`")
+                database.execSQL("ALTER TABLE `messages_new` RENAME TO `messages`")
+                database.execSQL("CREATE INDEX IF NOT EXISTS `index_messages_conversationId_timestamp` ON `messages` (`conversationId`, `timestamp`)")
+                database.execSQL("CREATE INDEX IF NOT EXISTS `index_messages_status` ON `messages` (`status`)")
+                database.execSQL("CREATE INDEX IF NOT EXISTS `index_messages_groupId` ON `messages` (`groupId`)")
+            }
+        }
     }
 }
@@ -1,5 +1,6 @@
 package com.whisper2.app.data.local.db.dao
 
+import androidx.paging.PagingSource
 import androidx.room.*
 import com.whisper2.app.data.local.db.entities.MessageEntity
 import kotlinx.coroutines.flow.Flow
@@ -9,6 +10,11 @@ interface MessageDao {
     @Query("SELECT * FROM messages WHERE conversationId = :conversationId ORDER BY timestamp ASC")
     fun getMessagesForConversation(conversationId: String): Flow<List<MessageEntity>>
 
+    // Paged variant: every emission of the Flow<List> form materializes
+    // the entire history; this loads one page at a time, newest first.
+    @Query("SELECT * FROM messages WHERE conversationId = :conversationId ORDER BY timestamp DESC")
+    fun getMessagesPaged(conversationId: String): PagingSource<Int, MessageEntity>
+
     @Query("SELECT * FROM messages WHERE id = :messageId")
     suspend fun getMessageById(messageId: String): MessageEntity?
 
@@ -24,6 +30,11 @@ interface MessageDao {
     @Query("UPDATE messages SET status = :status WHERE id = :messageId")
     suspend fun updateStatus(messageId: String, status: String)
 
+    // Receipts burst when a peer reads a whole conversation; one IN-list
+    // UPDATE writes a single WAL record instead of one commit per id.
+    @Query("UPDATE messages SET status = :status WHERE id IN (:ids)")
+    suspend fun updateStatusBatch(ids: List<String>, status: String)
+
     @Query("UPDATE messages SET attachmentLocalPath = :localPath WHERE id = :messageId")
     suspend fun updateAttachmentLocalPath(messageId: String, localPath: String)
 
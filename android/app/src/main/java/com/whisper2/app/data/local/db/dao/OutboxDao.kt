@@ -2,11 +2,15 @@ package com.whisper2.app.data.local.db.dao
 
 import androidx.room.*
 import com.whisper2.app.data.local.db.entities.OutboxEntity
+import kotlinx.coroutines.flow.Flow
 
 @Dao
 interface OutboxDao {
-    @Query("SELECT * FROM outbox WHERE status = 'pending' ORDER BY createdAt ASC")
-    suspend fun getPending(): List<OutboxEntity>
+    // Windowed so a big backlog after reconnect isn't decoded into memory
+    // at once (encryptedPayload can be large). Draining a batch invalidates
+    // the table, which makes the Flow emit the next window.
+    @Query("SELECT * FROM outbox WHERE status = 'pending' ORDER BY createdAt ASC LIMIT :limit")
+    fun getPending(limit: Int = 100): Flow<List<OutboxEntity>>
 
     @Insert(onConflict = OnConflictStrategy.REPLACE)
     suspend fun insert(entity: OutboxEntity)
@@ -2,6 +2,7 @@ package com.whisper2.app.data.local.db.entities
 
 import androidx.room.Entity
 import androidx.room.Ignore
+import androidx.room.Index
 import androidx.room.PrimaryKey
 import java.text.SimpleDateFormat
 import java.util.*
@@ -20,7 +21,7 @@ enum class DisappearingMessageTimer(val value: String, val displayName: String,
     }
 }
 
-@Entity(tableName = "conversations")
+@Entity(tableName = "conversations", indices = [Index("lastMessageTimestamp")])
 data class ConversationEntity(
     @PrimaryKey val peerId: String,
     val peerNickname: String?,
@@ -2,6 +2,7 @@ package com.whisper2.app.data.local.db.entities
 
 import androidx.room.Entity
 import androidx.room.Ignore
+import androidx.room.Index
 import androidx.room.PrimaryKey
 import java.text.SimpleDateFormat
 import java.util.*
@@ -26,7 +27,7 @@ data class GroupEntity(
         }
 }
 
-@Entity(tableName = "group_members")
+@Entity(tableName = "group_members", indices = [Index("groupId")])
 data class GroupMemberEntity(
     @PrimaryKey(autoGenerate = true) val id: Long = 0,
     val groupId: String,
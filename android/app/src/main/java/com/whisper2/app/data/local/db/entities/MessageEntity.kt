@@ -2,11 +2,21 @@ package com.whisper2.app.data.local.db.entities
 
 import androidx.room.Entity
 import androidx.room.Ignore
+import androidx.room.Index
 import androidx.room.PrimaryKey
 import java.text.SimpleDateFormat
 import java.util.*
 
-@Entity(tableName = "messages")
+@Entity(
+    tableName = "messages",
+    indices = [
+        // Conversation history is always WHERE conversationId ORDER BY
+        // timestamp; without this SQLite scans and sorts the whole table.
+        Index("conversationId", "timestamp"),
+        Index("status"),
+        Index("groupId")
+    ]
+)
 data class MessageEntity(
     @PrimaryKey val id: String,
     val conversationId: String,
@@ -33,12 +43,8 @@ data class MessageEntity(
     val attachmentThumbnail: String? = null,
     val attachmentLocalPath: String? = null,
 
-    // Location fields
-    val locationLatitude: Double? = null,
-    val locationLongitude: Double? = null,
-    val locationAccuracy: Float? = null,
-    val locationPlaceName: String? = null,
-    val locationAddress: String? = null,
+    // Location messages carry their coordinates in the content JSON;
+    // there are no dedicated location columns.
 
     val createdAt: Long = System.currentTimeMillis(),
     val readAt: Long? = null,
@@ -1,9 +1,10 @@
 package com.whisper2.app.data.local.db.entities
 
 import androidx.room.Entity
+import androidx.room.Index
 import androidx.room.PrimaryKey
 
-@Entity(tableName = "outbox")
+@Entity(tableName = "outbox", indices = [Index("status", "createdAt")])
 data class OutboxEntity(
     @PrimaryKey val messageId: String,
     val to: String,
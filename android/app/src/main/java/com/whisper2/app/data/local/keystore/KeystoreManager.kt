@@ -16,7 +16,19 @@ import javax.crypto.spec.GCMParameterSpec
 class KeystoreManager {
     private val keyStore: KeyStore = KeyStore.getInstance("AndroidKeyStore").apply { load(null) }
 
+    // getEntry round-trips through the KeyStore SPI (binder call on most
+    // devices); the key reference itself is stable, so fetch it once.
+    @Volatile
+    private var cachedKey: SecretKey? = null
+
     private fun getOrCreateKey(): SecretKey {
+        cachedKey?.let { return it }
+        return synchronized(this) {
+            cachedKey ?: loadOrCreateKey().also { cachedKey = it }
+        }
+    }
+
+    private fun loadOrCreateKey(): SecretKey {
         return if (keyStore.containsAlias(Constants.KEYSTORE_ALIAS)) {
             (keyStore.getEntry(Constants.KEYSTORE_ALIAS, null) as KeyStore.SecretKeyEntry).secretKey
         } else {
@@ -35,20 +47,24 @@ class KeystoreManager {
     fun wrapKey(keyToWrap: ByteArray): ByteArray {
         val cipher = Cipher.getInstance("AES/GCM/NoPadding")
         cipher.init(Cipher.ENCRYPT_MODE, getOrCreateKey())
-        val iv = cipher.iv
-        val ciphertext = cipher.doFinal(keyToWrap)
-        return iv + ciphertext
+        // Write IV and ciphertext straight into the output buffer instead
+        // of concatenating two intermediate arrays.
+        val output = ByteArray(12 + cipher.getOutputSize(keyToWrap.size))
+        cipher.iv.copyInto(output, 0)
+        cipher.doFinal(keyToWrap, 0, keyToWrap.size, output, 12)
+        return output
     }
 
     fun unwrapKey(wrappedKey: ByteArray): ByteArray {
-        val iv = wrappedKey.copyOfRange(0, 12)
-        val ciphertext = wrappedKey.copyOfRange(12, wrappedKey.size)
         val cipher = Cipher.getInstance("AES/GCM/NoPadding")
-        cipher.init(Cipher.DECRYPT_MODE, getOrCreateKey(), GCMParameterSpec(128, iv))
-        return cipher.doFinal(ciphertext)
+        // Read IV and ciphertext in place via the offset overloads rather
+        // than copyOfRange-ing the blob twice.
+        cipher.init(Cipher.DECRYPT_MODE, getOrCreateKey(), GCMParameterSpec(128, wrappedKey, 0, 12))
+        return cipher.doFinal(wrappedKey, 12, wrappedKey.size - 12)
     }
 
     fun deleteKey() {
+        cachedKey = null
         if (keyStore.containsAlias(Constants.KEYSTORE_ALIAS)) {
             keyStore.deleteEntry(Constants.KEYSTORE_ALIAS)
         }
@@ -47,41 +47,111 @@ class SecureStorage(private val context: Context, private val keystoreManager: K
         if (prefsFile.exists()) prefsFile.delete()
     }
 
+    // The private keys are read on every encrypt/decrypt; Base64 decode +
+    // Keystore unwrap per read adds up fast, so keep the decoded bytes
+    // after first use. Invalidated by clearAll().
+    @Volatile private var cachedEncPrivateKey: ByteArray? = null
+    @Volatile private var cachedSignPrivateKey: ByteArray? = null
+    @Volatile private var cachedContactsKey: ByteArray? = null
+    // Hot identity fields: EncryptedSharedPreferences decrypts the value
+    // on every getString, and these are read once per message.
+    @Volatile private var cachedWhisperId: String? = null
+    @Volatile private var cachedSessionToken: String? = null
+
+    init {
+        preload()
+    }
+
+    /**
+     * Warm the caches once at construction so the first message after
+     * launch doesn't pay the Base64 + Keystore unwrap on the hot path.
+     */
+    private fun preload() {
+        try {
+            cachedEncPrivateKey = prefs.getString("enc_priv", null)?.decodeBase64()?.let { keystoreManager.unwrapKey(it) }
+            cachedSignPrivateKey = prefs.getString("sign_priv", null)?.decodeBase64()?.let { keystoreManager.unwrapKey(it) }
+            cachedContactsKey = prefs.getString("contacts_key", null)?.decodeBase64()?.let { keystoreManager.unwrapKey(it) }
+            cachedWhisperId = prefs.getString("whisper_id", null)
+            cachedSessionToken = prefs.getString("session_token", null)
+        } catch (e: Exception) {
+            // Getters fall back to prefs, so a failed preload only costs speed
+            Logger.e("[SecureStorage] Failed to preload key cache", e)
+        }
+    }
+
+    /**
+     * Drop cached secrets, zeroing key material first.
+     */
+    fun invalidate() {
+        cachedEncPrivateKey?.fill(0)
+        cachedSignPrivateKey?.fill(0)
+        cachedContactsKey?.fill(0)
+        cachedEncPrivateKey = null
+        cachedSignPrivateKey = null
+        cachedContactsKey = null
+        cachedWhisperId = null
+        cachedSessionToken = null
+    }
+
     var encPrivateKey: ByteArray?
-        get() = prefs.getString("enc_priv", null)?.decodeBase64()?.let { keystoreManager.unwrapKey(it) }
-        set(value) = prefs.edit().putString("enc_priv", value?.let { keystoreManager.wrapKey(it).encodeBase64() }).apply()
+        get() = cachedEncPrivateKey
+            ?: prefs.getString("enc_priv", null)?.decodeBase64()
+                ?.let { keystoreManager.unwrapKey(it) }
+                ?.also { cachedEncPrivateKey = it }
+        set(value) {
+            cachedEncPrivateKey = value
+            prefs.edit().putString("enc_priv", value?.let { keystoreManager.wrapKey(it).encodeBase64() }).apply()
+        }
 
     var encPublicKey: ByteArray?
         get() = prefs.getString("enc_pub", null)?.decodeBase64()
         set(value) = prefs.edit().putString("enc_pub", value?.encodeBase64()).apply()
 
     var signPrivateKey: ByteArray?
-        get() = prefs.getString("sign_priv", null)?.decodeBase64()?.let { keystoreManager.unwrapKey(it) }
-        set(value) = prefs.edit().putString("sign_priv", value?.let { keystoreManager.wrapKey(it).encodeBase64() }).apply()
+        get() = cachedSignPrivateKey
+            ?: prefs.getString("sign_priv", null)?.decodeBase64()
+                ?.let { keystoreManager.unwrapKey(it) }
+                ?.also { cachedSignPrivateKey = it }
+        set(value) {
+            cachedSignPrivateKey = value
+            prefs.edit().putString("sign_priv", value?.let { keystoreManager.wrapKey(it).encodeBase64() }).apply()
+        }
 
     var signPublicKey: ByteArray?
         get() = prefs.getString("sign_pub", null)?.decodeBase64()
         set(value) = prefs.edit().putString("sign_pub", value?.encodeBase64()).apply()
 
     var contactsKey: ByteArray?
-        get() = prefs.getString("contacts_key", null)?.decodeBase64()?.let { keystoreManager.unwrapKey(it) }
-        set(value) = prefs.edit().putString("contacts_key", value?.let { keystoreManager.wrapKey(it).encodeBase64() }).apply()
+        get() = cachedContactsKey
+            ?: prefs.getString("contacts_key", null)?.decodeBase64()
+                ?.let { keystoreManager.unwrapKey(it) }
+                ?.also { cachedContactsKey = it }
+        set(value) {
+            cachedContactsKey = value
+            prefs.edit().putString("contacts_key", value?.let { keystoreManager.wrapKey(it).encodeBase64() }).apply()
+        }
 
     var mnemonic: String?
-        get() = prefs.getString("mnemonic", null)?.decodeBase64()?.let { String(keystoreManager.unwrapKey(it), Charsets.UTF_8) }
-        set(value) = prefs.edit().putString("mnemonic", value?.toByteArray()?.let { keystoreManager.wrapKey(it).encodeBase64() }).apply()
+        get() = prefs.getString("mnemonic", null)?.decodeBase64()?.let { keystoreManager.unwrapKey(it).decodeToString() }
+        set(value) = prefs.edit().putString("mnemonic", value?.encodeToByteArray()?.let { keystoreManager.wrapKey(it).encodeBase64() }).apply()
 
     var sessionToken: String?
-        get() = prefs.getString("session_token", null)
-        set(value) = prefs.edit().putString("session_token", value).apply()
+        get() = cachedSessionToken ?: prefs.getString("session_token", null)?.also { cachedSessionToken = it }
+        set(value) {
+            cachedSessionToken = value
+            prefs.edit().putString("session_token", value).apply()
+        }
 
     var sessionExpiresAt: Long
         get() = prefs.getLong("session_expires_at", 0L)
         set(value) = prefs.edit().putLong("session_expires_at", value).apply()
 
     var whisperId: String?
-        get() = prefs.getString("whisper_id", null)
-        set(value) = prefs.edit().putString("whisper_id", value).apply()
+        get() = cachedWhisperId ?: prefs.getString("whisper_id", null)?.also { cachedWhisperId = it }
+        set(value) {
+            cachedWhisperId = value
+            prefs.edit().putString("whisper_id", value).apply()
+        }
 
     var fcmToken: String?
         get() = prefs.getString("fcm_token", null)
@@ -293,7 +363,53 @@ class SecureStorage(private val context: Context, private val keystoreManager: K
             .apply()
     }
 
+    /**
+     * Store all key material derived at registration/recovery in one edit.
+     * Each field setter commits separately (an encryption + disk write per
+     * call); login sets six of them back to back, so batch the whole set
+     * into a single EncryptedSharedPreferences apply.
+     *
+     * This is also the persistent derived-key cache: the BIP39 PBKDF2 +
+     * HKDF chain runs only here, and every later unlock reads the
+     * Keystore-wrapped blobs back (milliseconds) instead of re-deriving.
+     * clearAll() on logout is the eviction path.
+     */
+    fun setDerivedKeys(
+        mnemonic: String,
+        encPublicKey: ByteArray,
+        encPrivateKey: ByteArray,
+        signPublicKey: ByteArray,
+        signPrivateKey: ByteArray,
+        contactsKey: ByteArray
+    ) {
+        cachedEncPrivateKey = encPrivateKey
+        cachedSignPrivateKey = signPrivateKey
+        cachedContactsKey = contactsKey
+        prefs.edit()
+            .putString("mnemonic", keystoreManager.wrapKey(mnemonic.encodeToByteArray()).encodeBase64())
+            .putString("enc_pub", encPublicKey.encodeBase64())
+            .putString("enc_priv", keystoreManager.wrapKey(encPrivateKey).encodeBase64())
+            .putString("sign_pub", signPublicKey.encodeBase64())
+            .putString("sign_priv", keystoreManager.wrapKey(signPrivateKey).encodeBase64())
+            .putString("contacts_key", keystoreManager.wrapKey(contactsKey).encodeBase64())
+            .apply()
+    }
+
+    /**
+     * Store the authenticated session in one edit.
+     */
+    fun setSession(whisperId: String, sessionToken: String, sessionExpiresAt: Long) {
+        cachedWhisperId = whisperId
+        cachedSessionToken = sessionToken
+        prefs.edit()
+            .putString("whisper_id", whisperId)
+            .putString("session_token", sessionToken)
+            .putLong("session_expires_at", sessionExpiresAt)
+            .apply()
+    }
+
     fun clearAll() {
+        invalidate()
         prefs.edit().clear().apply()
         keystoreManager.deleteKey()
     }
@@ -1,6 +1,7 @@
 package com.whisper2.app.data.network.api
 
-import com.google.gson.annotations.SerializedName
+import kotlinx.serialization.SerialName
+import kotlinx.serialization.Serializable
 import retrofit2.http.*
 
 interface AttachmentsApi {
@@ -17,21 +18,25 @@ interface AttachmentsApi {
     ): PresignDownloadResponse
 }
 
-// Field names must match server protocol exactly - use @SerializedName for ProGuard safety
+// Field names must match server protocol exactly - use @SerialName for ProGuard safety
+@Serializable
 data class PresignUploadRequest(
-    @SerializedName("contentType") val contentType: String,
-    @SerializedName("sizeBytes") val sizeBytes: Long
+    @SerialName("contentType") val contentType: String,
+    @SerialName("sizeBytes") val sizeBytes: Long
 )
 
+@Serializable
 data class PresignUploadResponse(
-    @SerializedName("objectKey") val objectKey: String,
-    @SerializedName("uploadUrl") val uploadUrl: String
+    @SerialName("objectKey") val objectKey: String,
+    @SerialName("uploadUrl") val uploadUrl: String
 )
 
+@Serializable
 data class PresignDownloadRequest(
-    @SerializedName("objectKey") val objectKey: String
+    @SerialName("objectKey") val objectKey: String
 )
 
+@Serializable
 data class PresignDownloadResponse(
-    @SerializedName("downloadUrl") val downloadUrl: String
+    @SerialName("downloadUrl") val downloadUrl: String
 )
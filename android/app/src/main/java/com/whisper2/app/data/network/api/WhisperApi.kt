@@ -1,6 +1,7 @@
 package com.whisper2.app.data.network.api
 
-import com.google.gson.annotations.SerializedName
+import kotlinx.serialization.SerialName
+import kotlinx.serialization.Serializable
 import retrofit2.http.*
 
 interface WhisperApi {
@@ -30,25 +31,30 @@ interface WhisperApi {
     suspend fun healthCheck(): HealthResponse
 }
 
+@Serializable
 data class UserKeysResponse(
-    @SerializedName("whisperId") val whisperId: String,
-    @SerializedName("encPublicKey") val encPublicKey: String,
-    @SerializedName("signPublicKey") val signPublicKey: String
+    @SerialName("whisperId") val whisperId: String,
+    @SerialName("encPublicKey") val encPublicKey: String,
+    @SerialName("signPublicKey") val signPublicKey: String
 )
 
+@Serializable
 data class ContactsBackupRequest(
-    @SerializedName("encryptedData") val encryptedData: String
+    @SerialName("encryptedData") val encryptedData: String
 )
 
+@Serializable
 data class ContactsBackupResponse(
-    @SerializedName("encryptedData") val encryptedData: String?,
-    @SerializedName("updatedAt") val updatedAt: Long?
+    @SerialName("encryptedData") val encryptedData: String?,
+    @SerialName("updatedAt") val updatedAt: Long?
 )
 
+@Serializable
 data class DeleteResponse(
-    @SerializedName("success") val success: Boolean
+    @SerialName("success") val success: Boolean
 )
 
+@Serializable
 data class HealthResponse(
-    @SerializedName("status") val status: String
+    @SerialName("status") val status: String
 )
@@ -4,14 +4,17 @@ import android.content.Context
 import android.os.PowerManager
 import com.google.gson.Gson
 import com.google.gson.JsonElement
+import com.google.gson.TypeAdapter
 import com.google.gson.reflect.TypeToken
 import com.whisper2.app.core.Constants
 import com.whisper2.app.core.Logger
 import com.whisper2.app.di.ApplicationScope
 import com.whisper2.app.di.WsClient
 import dagger.hilt.android.qualifiers.ApplicationContext
+import kotlinx.coroutines.CompletableDeferred
 import kotlinx.coroutines.CoroutineScope
 import kotlinx.coroutines.Job
+import kotlinx.coroutines.channels.Channel
 import kotlinx.coroutines.delay
 import kotlinx.coroutines.flow.MutableSharedFlow
 import kotlinx.coroutines.flow.MutableStateFlow
@@ -26,6 +29,11 @@ import okhttp3.Request
 import okhttp3.Response
 import okhttp3.WebSocket
 import okhttp3.WebSocketListener
+import okio.Buffer
+import okio.ByteString
+import java.io.InputStreamReader
+import java.io.OutputStreamWriter
+import java.util.concurrent.ConcurrentHashMap
 import javax.inject.Inject
 import javax.inject.Singleton
 
@@ -47,12 +55,45 @@ class WsClientImpl @Inject constructor(
     private val _messages = MutableSharedFlow<WsFrame<JsonElement>>(extraBufferCapacity = 100)
     val messages = _messages.asSharedFlow()
 
+    // Resolved once: gson.fromJson/toJson re-dispatch through the adapter
+    // registry per call, and the inline TypeToken is an anonymous-class
+    // allocation per frame.
+    @Suppress("UNCHECKED_CAST")
+    private val frameAdapter: TypeAdapter<WsFrame<JsonElement>> =
+        gson.getAdapter(TypeToken.get(FRAME_TYPE)) as TypeAdapter<WsFrame<JsonElement>>
+
+    // Outbound envelope adapter, resolved once. Payload fields still
+    // dispatch on their runtime class (same output as gson.toJson), but
+    // the per-send adapter-registry lookup is gone.
+    @Suppress("UNCHECKED_CAST")
+    private val outboundAdapter: TypeAdapter<WsFrame<*>> =
+        gson.getAdapter(WsFrame::class.java) as TypeAdapter<WsFrame<*>>
+
+    // Per-type payload adapters, memoized on first frame of each type:
+    // gson.fromJson re-walks the adapter registry per call, and the set
+    // of inbound types is small and stable. Dispatch coroutines run
+    // concurrently on the application scope, so the memo must be a
+    // ConcurrentHashMap; getAdapter is idempotent, making a lost race
+    // in computeIfAbsent harmless.
+    private val payloadAdapters = ConcurrentHashMap<String, TypeAdapter<*>>()
+
+    private fun payloadAdapterFor(type: String): TypeAdapter<*>? {
+        val payloadClass = WsPayloadTypes.classFor(type) ?: return null
+        return payloadAdapters.computeIfAbsent(type) { gson.getAdapter(payloadClass) }
+    }
+
     private val reconnectPolicy = WsReconnectPolicy()
 
-    // Heartbeat tracking
-    private var heartbeatJob: Job? = null
-    private var lastPongTime: Long = System.currentTimeMillis()
-    private val pongTimeout: Long = 60_000  // 60 seconds timeout for pong
+    /** A queued outbound frame, or a flush marker when [frame] is null. */
+    private class Outbound(val frame: WsFrame<*>?, val flushed: CompletableDeferred<Unit>? = null)
+
+    // Outbound frames go through one writer coroutine (launched once for
+    // the process) so send() never blocks and bursts drain back to back.
+    private val sendQueue = Channel<Outbound>(Channel.UNLIMITED)
+
+    init {
+        scope.launch { writerLoop() }
+    }
 
     // Reconnect job - track so we can cancel on network restore
     private var reconnectJob: Job? = null
@@ -85,32 +126,27 @@ class WsClientImpl @Inject constructor(
                 Logger.ws("Connected")
                 _connectionState.value = WsConnectionState.CONNECTED
                 reconnectPolicy.reset()
-                lastPongTime = System.currentTimeMillis()
-                startHeartbeat()
                 releaseWakeLock()  // Connection established, release wake lock
             }
 
             override fun onMessage(webSocket: WebSocket, text: String) {
                 scope.launch {
                     try {
-                        val frameType = object : TypeToken<WsFrame<JsonElement>>() {}.type
-                        val frame: WsFrame<JsonElement> = gson.fromJson(text, frameType)
-                        Logger.ws("Received: ${frame.type}")
-
-                        // Handle PING from server - respond with PONG
-                        if (frame.type == Constants.MsgType.PING) {
-                            handleServerPing(frame.payload)
-                            return@launch
-                        }
-
-                        // Handle PONG from server - update last pong time
-                        if (frame.type == Constants.MsgType.PONG) {
-                            lastPongTime = System.currentTimeMillis()
-                            Logger.ws("Pong received")
-                            return@launch
-                        }
-
-                        _messages.emit(frame)
+                        dispatchFrame(frameAdapter.fromJson(text))
+                    } catch (e: Exception) {
+                        Logger.e("Failed to parse WS message", e)
+                    }
+                }
+            }
+
+            override fun onMessage(webSocket: WebSocket, bytes: ByteString) {
+                // Binary frames are parsed straight off the wire bytes; a
+                // text frame would force OkHttp to decode the whole payload
+                // into a String before Gson re-reads it char by char.
+                scope.launch {
+                    try {
+                        val reader = InputStreamReader(Buffer().write(bytes).inputStream(), Charsets.UTF_8)
+                        dispatchFrame(frameAdapter.fromJson(reader))
                     } catch (e: Exception) {
                         Logger.e("Failed to parse WS message", e)
                     }
@@ -119,7 +155,6 @@ class WsClientImpl @Inject constructor(
 
             override fun onFailure(webSocket: WebSocket, t: Throwable, response: Response?) {
                 Logger.e("WebSocket failure", t)
-                stopHeartbeat()
                 releaseWakeLock()  // Release wake lock on failure
                 _connectionState.value = WsConnectionState.DISCONNECTED
                 attemptReconnect()
@@ -127,7 +162,6 @@ class WsClientImpl @Inject constructor(
 
             override fun onClosed(webSocket: WebSocket, code: Int, reason: String) {
                 Logger.ws("Closed: $code $reason")
-                stopHeartbeat()
                 releaseWakeLock()  // Release wake lock on close
                 _connectionState.value = WsConnectionState.DISCONNECTED
                 // Also attempt reconnect on normal close (server may have restarted)
@@ -138,6 +172,40 @@ class WsClientImpl @Inject constructor(
         })
     }
 
+    /**
+     * Route a parsed frame: answer PING/PONG inline, emit the rest.
+     * Shared by the text and binary onMessage paths.
+     */
+    private suspend fun dispatchFrame(frame: WsFrame<JsonElement>) {
+        Logger.ws("Received: ${frame.type}")
+
+        // Handle PING from server - respond with PONG
+        if (frame.type == Constants.MsgType.PING) {
+            handleServerPing(frame.payload)
+            return
+        }
+
+        // Handle PONG from server (reply to the app-level ping sent on
+        // foreground; liveness is enforced by OkHttp's protocol pings)
+        if (frame.type == Constants.MsgType.PONG) {
+            Logger.ws("Pong received")
+            return
+        }
+
+        // Decode the payload once for registered types; collectors read
+        // it via payloadAs instead of re-parsing the JsonElement.
+        val adapter = payloadAdapterFor(frame.type)
+        if (adapter != null && frame.payload != null) {
+            try {
+                frame.decoded = adapter.fromJsonTree(frame.payload)
+            } catch (e: Exception) {
+                Logger.e("Failed to decode ${frame.type} payload", e)
+            }
+        }
+
+        _messages.emit(frame)
+    }
+
     /**
      * Handle PING from server by sending PONG response
      */
@@ -160,42 +228,49 @@ class WsClientImpl @Inject constructor(
         }
     }
 
+    /**
+     * Enqueue a frame for the writer coroutine. Non-blocking: callers on
+     * the receive path or UI thread never pay for Gson serialization.
+     */
     fun <T> send(frame: WsFrame<T>) {
-        val json = gson.toJson(frame)
-        Logger.ws("Sending: ${frame.type}")
-        webSocket?.send(json)
+        sendQueue.trySend(Outbound(frame))
     }
 
-    private fun startHeartbeat() {
-        stopHeartbeat()
-        lastPongTime = System.currentTimeMillis()
-
-        heartbeatJob = scope.launch {
-            while (connectionState.value == WsConnectionState.CONNECTED) {
-                delay(Constants.HEARTBEAT_INTERVAL_MS)
-
-                if (connectionState.value == WsConnectionState.CONNECTED) {
-                    // Check if we've received a pong recently
-                    val timeSinceLastPong = System.currentTimeMillis() - lastPongTime
-                    if (timeSinceLastPong > pongTimeout) {
-                        Logger.ws("Pong timeout (${timeSinceLastPong}ms since last pong), closing connection")
-                        webSocket?.close(1000, "Pong timeout")
-                        _connectionState.value = WsConnectionState.DISCONNECTED
-                        attemptReconnect()
-                        break
-                    }
+    /** Suspend until every frame enqueued before this call has been written. */
+    suspend fun flush() {
+        val marker = CompletableDeferred<Unit>()
+        sendQueue.send(Outbound(null, marker))
+        marker.await()
+    }
 
-                    // Send ping
-                    send(WsFrame(Constants.MsgType.PING, payload = PingPayload(System.currentTimeMillis())))
-                    Logger.ws("Ping sent")
-                }
+    /**
+     * Single writer: blocks on the first queued frame, then drains the
+     * burst with tryReceive so group fanout / outbox retries / receipt
+     * storms hand OkHttp a tight run of frames in one scheduling quantum
+     * instead of one coroutine hop per frame.
+     */
+    private suspend fun writerLoop() {
+        while (true) {
+            var item: Outbound? = sendQueue.receive()
+            while (item != null) {
+                writeFrame(item)
+                item = sendQueue.tryReceive().getOrNull()
             }
         }
     }
 
-    private fun stopHeartbeat() {
-        heartbeatJob?.cancel()
-        heartbeatJob = null
+    private fun writeFrame(item: Outbound) {
+        val frame = item.frame
+        if (frame != null) {
+            Logger.ws("Sending: ${frame.type}")
+            // Serialize straight into an Okio buffer and send a binary frame;
+            // going through a String would build UTF-16 only for OkHttp to
+            // re-encode it to UTF-8. The server parses the raw bytes either way.
+            val buffer = Buffer()
+            OutputStreamWriter(buffer.outputStream(), Charsets.UTF_8).use { outboundAdapter.toJson(it, frame) }
+            webSocket?.send(buffer.readByteString())
+        }
+        item.flushed?.complete(Unit)
     }
 
     private fun attemptReconnect() {
@@ -235,11 +310,10 @@ class WsClientImpl @Inject constructor(
     fun handleAppBackground() {
         Logger.ws("App entered background")
         // Don't disconnect - let Android manage the connection
-        // But the heartbeat will continue in the coroutine scope
+        // OkHttp keeps sending protocol pings while the socket is up
     }
 
     fun disconnect() {
-        stopHeartbeat()
         reconnectJob?.cancel()
         reconnectJob = null
         webSocket?.close(1000, "Client disconnect")
@@ -269,7 +343,7 @@ class WsClientImpl @Inject constructor(
             ).apply {
                 acquire(wakeLockTimeout)
             }
-            Logger.d("WsClient wake lock acquired")
+            Logger.d { "WsClient wake lock acquired" }
         } catch (e: Exception) {
             Logger.e("Failed to acquire wake lock", e)
         }
@@ -282,7 +356,7 @@ class WsClientImpl @Inject constructor(
         try {
             if (wakeLock?.isHeld == true) {
                 wakeLock?.release()
-                Logger.d("WsClient wake lock released")
+                Logger.d { "WsClient wake lock released" }
             }
         } catch (e: Exception) {
             Logger.e("Failed to release wake lock", e)
@@ -297,6 +371,12 @@ class WsClientImpl @Inject constructor(
         reconnectPolicy.reset()
     }
 
+    companion object {
+        // One TypeToken for the frame envelope instead of an anonymous
+        // class per onMessage call.
+        private val FRAME_TYPE = object : TypeToken<WsFrame<JsonElement>>() {}.type
+    }
+
     /**
      * Update network availability status.
      * Called by App when network connectivity changes.
@@ -345,7 +425,7 @@ class WsClientImpl @Inject constructor(
                 }
                 else -> {
                     // CONNECTED, CONNECTING, AUTH_EXPIRED - no action needed
-                    Logger.d("Network restored but state is $currentState - no reconnect needed")
+                    Logger.d { "Network restored but state is $currentState - no reconnect needed" }
                 }
             }
         }
@@ -8,7 +8,21 @@ data class WsFrame<T>(
     val type: String,
     val requestId: String? = null,
     val payload: T
-)
+) {
+    /**
+     * Concrete payload, decoded once on the WS read path for frame types
+     * registered in [WsPayloadTypes]. Not part of the wire format.
+     */
+    @Transient
+    var decoded: Any? = null
+}
+
+/**
+ * Typed payload accessor: returns the payload decoded by the read path,
+ * or falls back to a Gson parse for unregistered frame types.
+ */
+inline fun <reified T> WsFrame<JsonElement>.payloadAs(gson: com.google.gson.Gson): T =
+    decoded as? T ?: gson.fromJson(payload, T::class.java)
 
 // Registration
 data class RegisterBeginPayload(
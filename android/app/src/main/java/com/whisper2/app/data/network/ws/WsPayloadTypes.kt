@@ -0,0 +1,51 @@
+package com.whisper2.app.data.network.ws
+
+import com.whisper2.app.core.Constants
+import java.util.concurrent.ConcurrentHashMap
+
+/**
+ * Registry of inbound frame type → concrete payload class.
+ *
+ * The WS read path decodes the payload once into [WsFrame.decoded] using
+ * this table, so every collector of the shared messages flow gets the
+ * typed payload without running a second Gson parse on the same bytes.
+ * Services that own their payload models (e.g. groups) register them
+ * from their own init blocks - on whatever thread Hilt constructs them,
+ * concurrent with dispatch lookups, so the table is a ConcurrentHashMap
+ * for safe publication of late entries.
+ */
+object WsPayloadTypes {
+
+    private val types = ConcurrentHashMap<String, Class<*>>(32).apply {
+        // Auth
+        put(Constants.MsgType.REGISTER_CHALLENGE, RegisterChallengePayload::class.java)
+        put(Constants.MsgType.REGISTER_ACK, RegisterAckPayload::class.java)
+        put(Constants.MsgType.SESSION_REFRESH_ACK, SessionRefreshAckPayload::class.java)
+        put(Constants.MsgType.ERROR, ErrorPayload::class.java)
+
+        // Messaging
+        put(Constants.MsgType.MESSAGE_RECEIVED, MessageReceivedPayload::class.java)
+        put(Constants.MsgType.MESSAGE_ACCEPTED, MessageAcceptedPayload::class.java)
+        put(Constants.MsgType.DELIVERY_RECEIPT, DeliveryReceiptPayload::class.java)
+        put(Constants.MsgType.MESSAGE_DELIVERED, MessageDeliveredPayload::class.java)
+        put(Constants.MsgType.PENDING_MESSAGES, PendingMessagesPayload::class.java)
+        put(Constants.MsgType.MESSAGE_DELETED, MessageDeletedPayload::class.java)
+        put(Constants.MsgType.TYPING_NOTIFICATION, TypingNotificationPayload::class.java)
+        put(Constants.MsgType.PRESENCE_UPDATE, PresenceUpdatePayload::class.java)
+
+        // Calls - inbound notification shapes, not the outbound request shapes
+        put(Constants.MsgType.TURN_CREDENTIALS, TurnCredentialsPayload::class.java)
+        put(Constants.MsgType.CALL_INCOMING, CallIncomingPayload::class.java)
+        put(Constants.MsgType.CALL_ANSWER, CallAnswerNotificationPayload::class.java)
+        put(Constants.MsgType.CALL_ICE_CANDIDATE, CallIceCandidateNotificationPayload::class.java)
+        put(Constants.MsgType.CALL_END, CallEndNotificationPayload::class.java)
+        put(Constants.MsgType.CALL_RINGING, CallRingingNotificationPayload::class.java)
+    }
+
+    /** Register a payload class for an inbound frame type. */
+    fun register(type: String, payloadClass: Class<*>) {
+        types[type] = payloadClass
+    }
+
+    fun classFor(type: String): Class<*>? = types[type]
+}
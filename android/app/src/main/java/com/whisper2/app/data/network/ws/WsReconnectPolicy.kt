@@ -1,8 +1,9 @@
 package com.whisper2.app.data.network.ws
 
 import com.whisper2.app.core.Constants
+import kotlin.random.Random
 
-class WsReconnectPolicy {
+class WsReconnectPolicy(private val random: Random = Random.Default) {
     private var _attemptCount = 0
     val attemptCount: Int get() = _attemptCount
     private var isAuthExpired = false
@@ -14,10 +15,16 @@ class WsReconnectPolicy {
         return _attemptCount < Constants.RECONNECT_MAX_ATTEMPTS
     }
 
+    /**
+     * Full-jitter exponential backoff: a uniform delay in [0, cap] where
+     * cap doubles per attempt. A fixed base * 2^attempt would make every
+     * client that lost the server at the same moment reconnect at the
+     * same instant; jitter spreads the herd across the window.
+     */
     fun getDelayMs(): Long {
-        val delay = Constants.RECONNECT_BASE_DELAY_MS * (1 shl _attemptCount)
+        val cap = CAP_SCHEDULE[minOf(_attemptCount, CAP_SCHEDULE.lastIndex)]
         _attemptCount++
-        return minOf(delay, Constants.RECONNECT_MAX_DELAY_MS)
+        return random.nextLong(cap + 1)
     }
 
     fun reset() {
@@ -35,4 +42,15 @@ class WsReconnectPolicy {
     fun isNetworkAvailable(): Boolean = isNetworkAvailable
 
     fun isAuthenticationRequired(): Boolean = isAuthExpired
+
+    companion object {
+        // The cap sequence only has RECONNECT_MAX_ATTEMPTS distinct
+        // values, so it's spelled out once here - 1s, 2s, 4s, 8s, 16s
+        // with the current constants - and getDelayMs() reduces to an
+        // index plus one nextLong. Also the auditable source of truth
+        // for what the schedule actually is.
+        private val CAP_SCHEDULE = LongArray(Constants.RECONNECT_MAX_ATTEMPTS) { i ->
+            minOf(Constants.RECONNECT_BASE_DELAY_MS shl minOf(i, 30), Constants.RECONNECT_MAX_DELAY_MS)
+        }
+    }
 }
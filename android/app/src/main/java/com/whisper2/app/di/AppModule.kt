@@ -10,6 +10,7 @@ import kotlinx.coroutines.CoroutineDispatcher
 import kotlinx.coroutines.CoroutineScope
 import kotlinx.coroutines.Dispatchers
 import kotlinx.coroutines.SupervisorJob
+import kotlinx.serialization.json.Json
 import javax.inject.Qualifier
 import javax.inject.Singleton
 
@@ -20,6 +21,16 @@ import javax.inject.Singleton
 @Module
 @InstallIn(SingletonComponent::class)
 object AppModule {
+    // App-wide codec: compile-time serializers, no reflection or
+    // intermediate tree on the marshaling path.
+    @Provides @Singleton
+    fun provideJson(): Json = Json {
+        ignoreUnknownKeys = true
+        explicitNulls = false
+    }
+
+    // Still consumed by the WS frame layer, whose payload dispatch is
+    // runtime-typed; new code should take Json.
     @Provides @Singleton
     fun provideGson(): Gson = GsonBuilder().create()
 
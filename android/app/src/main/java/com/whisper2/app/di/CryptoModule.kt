@@ -19,6 +19,10 @@ object CryptoModule {
     @Provides @Singleton
     fun provideLazySodium(): LazySodiumAndroid = LazySodiumAndroid(SodiumAndroid())
 
+    // One shared instance: construction pulls a seed, so per-call-site
+    // `SecureRandom()` repeats that cost for nothing. The default on
+    // minSdk 26+ is the BoringSSL CTR-DRBG over /dev/urandom -
+    // non-blocking; explicitly requesting SHA1PRNG would be a downgrade.
     @Provides @Singleton
     fun provideSecureRandom(): SecureRandom = SecureRandom()
 
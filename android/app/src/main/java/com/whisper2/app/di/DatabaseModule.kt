@@ -2,6 +2,7 @@ package com.whisper2.app.di
 
 import android.content.Context
 import androidx.room.Room
+import androidx.room.RoomDatabase
 import com.whisper2.app.core.Constants
 import com.whisper2.app.data.local.db.WhisperDatabase
 import dagger.Module
@@ -9,13 +10,18 @@ import dagger.Provides
 import dagger.hilt.InstallIn
 import dagger.hilt.android.qualifiers.ApplicationContext
 import dagger.hilt.components.SingletonComponent
+import kotlinx.coroutines.CoroutineDispatcher
+import kotlinx.coroutines.asExecutor
 import javax.inject.Singleton
 
 @Module
 @InstallIn(SingletonComponent::class)
 object DatabaseModule {
     @Provides @Singleton
-    fun provideDatabase(@ApplicationContext ctx: Context): WhisperDatabase =
+    fun provideDatabase(
+        @ApplicationContext ctx: Context,
+        @IoDispatcher dispatcher: CoroutineDispatcher
+    ): WhisperDatabase =
         Room.databaseBuilder(ctx, WhisperDatabase::class.java, Constants.DATABASE_NAME)
             .addMigrations(
                 WhisperDatabase.MIGRATION_1_2,
@@ -23,8 +29,18 @@ object DatabaseModule {
                 WhisperDatabase.MIGRATION_3_4,
                 WhisperDatabase.MIGRATION_4_5,
                 WhisperDatabase.MIGRATION_5_6,
-                WhisperDatabase.MIGRATION_6_7
+                WhisperDatabase.MIGRATION_6_7,
+                WhisperDatabase.MIGRATION_7_8,
+                WhisperDatabase.MIGRATION_8_9
             )
+            // WAL lets the chat list keep reading while the WS consumer
+            // commits incoming messages; TRUNCATE blocks readers per write.
+            .setJournalMode(RoomDatabase.JournalMode.WRITE_AHEAD_LOGGING)
+            // Run queries/transactions on the shared IO dispatcher instead
+            // of Room's own small arch-executor pool, which can starve when
+            // inserts, receipts, and conversation updates race under WS load.
+            .setQueryExecutor(dispatcher.asExecutor())
+            .setTransactionExecutor(dispatcher.asExecutor())
             .build()
 
     @Provides fun messageDao(db: WhisperDatabase) = db.messageDao()
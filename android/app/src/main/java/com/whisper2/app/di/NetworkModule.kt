@@ -1,6 +1,5 @@
 package com.whisper2.app.di
 
-import com.google.gson.Gson
 import com.whisper2.app.core.Constants
 import com.whisper2.app.data.network.api.WhisperApi
 import com.whisper2.app.data.network.api.AttachmentsApi
@@ -8,10 +7,17 @@ import dagger.Module
 import dagger.Provides
 import dagger.hilt.InstallIn
 import dagger.hilt.components.SingletonComponent
+import okhttp3.ConnectionPool
+import okhttp3.Dispatcher
 import okhttp3.OkHttpClient
+import kotlinx.serialization.json.Json
+import okhttp3.MediaType.Companion.toMediaType
 import retrofit2.Retrofit
-import retrofit2.converter.gson.GsonConverterFactory
+import retrofit2.converter.kotlinx.serialization.asConverterFactory
+import java.net.InetAddress
+import java.net.Socket
 import java.util.concurrent.TimeUnit
+import javax.net.SocketFactory
 import javax.inject.Qualifier
 import javax.inject.Singleton
 
@@ -21,27 +27,60 @@ import javax.inject.Singleton
 @Module
 @InstallIn(SingletonComponent::class)
 object NetworkModule {
-    @Provides @Singleton @WsClient
-    fun provideWsClient(): OkHttpClient = OkHttpClient.Builder()
+
+    // Platform sockets with TCP_NODELAY (Nagle off - small frames like
+    // receipts and pongs leave immediately instead of waiting ~40ms to
+    // coalesce) and SO_KEEPALIVE (kernel-level dead-peer detection below
+    // the app-layer heartbeat).
+    private val lowLatencySocketFactory = object : SocketFactory() {
+        private fun configure(socket: Socket): Socket = socket.apply {
+            tcpNoDelay = true
+            keepAlive = true
+        }
+
+        override fun createSocket(): Socket = configure(Socket())
+        override fun createSocket(host: String?, port: Int): Socket = configure(Socket(host, port))
+        override fun createSocket(host: String?, port: Int, localHost: InetAddress?, localPort: Int): Socket =
+            configure(Socket(host, port, localHost, localPort))
+        override fun createSocket(host: InetAddress?, port: Int): Socket = configure(Socket(host, port))
+        override fun createSocket(address: InetAddress?, port: Int, localAddress: InetAddress?, localPort: Int): Socket =
+            configure(Socket(address, port, localAddress, localPort))
+    }
+
+    // One base client so REST and WS share the connection pool, dispatcher
+    // and TLS session cache: once the WebSocket is up, presign/API calls to
+    // the same host skip the TLS handshake. Variants below derive from it
+    // via newBuilder(), which keeps those shared internals.
+    private val baseClient: OkHttpClient = OkHttpClient.Builder()
         .connectTimeout(30, TimeUnit.SECONDS)
+        .socketFactory(lowLatencySocketFactory)
+        .connectionPool(ConnectionPool(5, 5, TimeUnit.MINUTES))
+        .dispatcher(Dispatcher().apply { maxRequestsPerHost = 8 })
+        .build()
+
+    @Provides @Singleton @WsClient
+    fun provideWsClient(): OkHttpClient = baseClient.newBuilder()
         .readTimeout(0, TimeUnit.SECONDS)  // Disabled for WebSocket
         .writeTimeout(30, TimeUnit.SECONDS)
-        // REMOVED: pingInterval - we handle pings at application level
-        // OkHttp's pingInterval can conflict with app-level heartbeat and cause unexpected disconnects
+        // Protocol-level keepalive: OkHttp sends a 2-byte ping frame per
+        // interval and fails the connection itself when the pong doesn't
+        // arrive, replacing the old app-level heartbeat coroutine (which
+        // Gson-encoded a JSON ping per tick). Safe to combine now that
+        // WsClientImpl no longer runs its own ping loop.
+        .pingInterval(Constants.HEARTBEAT_INTERVAL_MS, TimeUnit.MILLISECONDS)
         .build()
 
     @Provides @Singleton @HttpClient
-    fun provideHttpClient(): OkHttpClient = OkHttpClient.Builder()
-        .connectTimeout(30, TimeUnit.SECONDS)
+    fun provideHttpClient(): OkHttpClient = baseClient.newBuilder()
         .readTimeout(60, TimeUnit.SECONDS)
         .writeTimeout(60, TimeUnit.SECONDS)
         .build()
 
     @Provides @Singleton
-    fun provideRetrofit(@HttpClient client: OkHttpClient, gson: Gson): Retrofit = Retrofit.Builder()
+    fun provideRetrofit(@HttpClient client: OkHttpClient, json: Json): Retrofit = Retrofit.Builder()
         .baseUrl(Constants.BASE_URL)
         .client(client)
-        .addConverterFactory(GsonConverterFactory.create(gson))
+        .addConverterFactory(json.asConverterFactory("application/json".toMediaType()))
         .build()
 
     @Provides @Singleton
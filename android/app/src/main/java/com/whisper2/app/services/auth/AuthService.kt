@@ -21,6 +21,7 @@ import com.whisper2.app.data.network.ws.UpdateTokensPayload
 import com.whisper2.app.data.network.ws.WsClientImpl
 import com.whisper2.app.data.network.ws.WsConnectionState
 import com.whisper2.app.data.network.ws.WsFrame
+import com.whisper2.app.data.network.ws.payloadAs
 import dagger.hilt.android.qualifiers.ApplicationContext
 import kotlinx.coroutines.*
 import kotlinx.coroutines.flow.*
@@ -87,12 +88,14 @@ class AuthService @Inject constructor(
             val keys = cryptoService.deriveKeys(mnemonic)
 
             // Store keys securely (needed for signing the challenge)
-            secureStorage.mnemonic = mnemonic
-            secureStorage.encPublicKey = keys.encPublicKey
-            secureStorage.encPrivateKey = keys.encPrivateKey
-            secureStorage.signPublicKey = keys.signPublicKey
-            secureStorage.signPrivateKey = keys.signPrivateKey
-            secureStorage.contactsKey = keys.contactsKey
+            secureStorage.setDerivedKeys(
+                mnemonic = mnemonic,
+                encPublicKey = keys.encPublicKey,
+                encPrivateKey = keys.encPrivateKey,
+                signPublicKey = keys.signPublicKey,
+                signPrivateKey = keys.signPrivateKey,
+                contactsKey = keys.contactsKey
+            )
 
             // 2. Connect to WebSocket
             wsClient.connect()
@@ -107,9 +110,7 @@ class AuthService @Inject constructor(
             )
 
             // 4. Store server-assigned WhisperID and session
-            secureStorage.whisperId = ack.whisperId
-            secureStorage.sessionToken = ack.sessionToken
-            secureStorage.sessionExpiresAt = ack.sessionExpiresAt
+            secureStorage.setSession(ack.whisperId, ack.sessionToken, ack.sessionExpiresAt)
 
             Logger.auth("Registration successful. WhisperID: ${ack.whisperId}")
 
@@ -139,12 +140,14 @@ class AuthService @Inject constructor(
             val keys = cryptoService.deriveKeys(mnemonic)
 
             // Store keys securely
-            secureStorage.mnemonic = mnemonic
-            secureStorage.encPublicKey = keys.encPublicKey
-            secureStorage.encPrivateKey = keys.encPrivateKey
-            secureStorage.signPublicKey = keys.signPublicKey
-            secureStorage.signPrivateKey = keys.signPrivateKey
-            secureStorage.contactsKey = keys.contactsKey
+            secureStorage.setDerivedKeys(
+                mnemonic = mnemonic,
+                encPublicKey = keys.encPublicKey,
+                encPrivateKey = keys.encPrivateKey,
+                signPublicKey = keys.signPublicKey,
+                signPrivateKey = keys.signPrivateKey,
+                contactsKey = keys.contactsKey
+            )
 
             // Connect and authenticate
             wsClient.connect()
@@ -159,9 +162,7 @@ class AuthService @Inject constructor(
             )
 
             // Store session
-            secureStorage.whisperId = ack.whisperId
-            secureStorage.sessionToken = ack.sessionToken
-            secureStorage.sessionExpiresAt = ack.sessionExpiresAt
+            secureStorage.setSession(ack.whisperId, ack.sessionToken, ack.sessionExpiresAt)
 
             Logger.auth("Recovery successful. WhisperID: ${ack.whisperId}")
 
@@ -341,7 +342,7 @@ class AuthService @Inject constructor(
         when (frame.type) {
             Constants.MsgType.REGISTER_CHALLENGE -> {
                 try {
-                    val payload = gson.fromJson(frame.payload, RegisterChallengePayload::class.java)
+                    val payload = frame.payloadAs<RegisterChallengePayload>(gson)
                     Logger.auth("Received challenge: ${payload.challengeId}")
                     challengeContinuation?.resume(payload)
                     challengeContinuation = null
@@ -354,7 +355,7 @@ class AuthService @Inject constructor(
 
             Constants.MsgType.REGISTER_ACK -> {
                 try {
-                    val payload = gson.fromJson(frame.payload, RegisterAckPayload::class.java)
+                    val payload = frame.payloadAs<RegisterAckPayload>(gson)
                     Logger.auth("Received ack: ${payload.whisperId}, success=${payload.success}")
                     if (payload.success) {
                         // FCM token already sent in register_proof - no need to sync again
@@ -372,7 +373,7 @@ class AuthService @Inject constructor(
 
             Constants.MsgType.ERROR -> {
                 try {
-                    val payload = gson.fromJson(frame.payload, ErrorPayload::class.java)
+                    val payload = frame.payloadAs<ErrorPayload>(gson)
                     Logger.e("Auth error: ${payload.code} - ${payload.message}")
                     val exception = AuthException("${payload.code}: ${payload.message}")
                     challengeContinuation?.resumeWithException(exception)
@@ -386,7 +387,7 @@ class AuthService @Inject constructor(
 
             Constants.MsgType.SESSION_REFRESH_ACK -> {
                 try {
-                    val payload = gson.fromJson(frame.payload, SessionRefreshAckPayload::class.java)
+                    val payload = frame.payloadAs<SessionRefreshAckPayload>(gson)
                     Logger.auth("Session refreshed: expires at ${payload.sessionExpiresAt}")
                     secureStorage.sessionToken = payload.sessionToken
                     secureStorage.sessionExpiresAt = payload.sessionExpiresAt
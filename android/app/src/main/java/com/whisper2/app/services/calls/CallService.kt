@@ -9,6 +9,7 @@ import com.google.gson.Gson
 import com.google.gson.JsonElement
 import com.whisper2.app.core.Constants
 import com.whisper2.app.core.Logger
+import com.whisper2.app.core.elapsedMillis
 import com.whisper2.app.crypto.CryptoService
 import com.whisper2.app.services.auth.AuthService
 import com.whisper2.app.services.auth.AuthState
@@ -32,6 +33,7 @@ import com.whisper2.app.data.network.ws.GetTurnCredentialsPayload
 import com.whisper2.app.data.network.ws.TurnCredentialsPayload
 import com.whisper2.app.data.network.ws.WsClientImpl
 import com.whisper2.app.data.network.ws.WsFrame
+import com.whisper2.app.data.network.ws.payloadAs
 import com.whisper2.app.di.ApplicationScope
 import dagger.hilt.android.qualifiers.ApplicationContext
 import kotlinx.coroutines.*
@@ -96,7 +98,7 @@ class CallService @Inject constructor(
     val activeCall: StateFlow<ActiveCall?> = _activeCall.asStateFlow()
 
     private val _turnCredentials = MutableStateFlow<TurnCredentialsPayload?>(null)
-    private var turnCredentialsReceivedAt: Long = 0  // Timestamp when credentials were received
+    private var turnCredentialsReceivedAt: Long = 0  // elapsedMillis() when credentials were received
 
     // WebRTC components
     private var peerConnectionFactory: PeerConnectionFactory? = null
@@ -358,12 +360,12 @@ class CallService @Inject constructor(
         fetchTurnCredentials()
 
         // Poll until credentials arrive or timeout
-        val startTime = System.currentTimeMillis()
+        val startTime = elapsedMillis()
         val checkInterval = 100L
 
-        while (System.currentTimeMillis() - startTime < timeout) {
+        while (elapsedMillis() - startTime < timeout) {
             if (_turnCredentials.value != null) {
-                Logger.i("[CallService] TURN credentials received after ${System.currentTimeMillis() - startTime}ms")
+                Logger.i("[CallService] TURN credentials received after ${elapsedMillis() - startTime}ms")
                 return true
             }
             delay(checkInterval)
@@ -381,10 +383,10 @@ class CallService @Inject constructor(
      * This ensures we don't send call commands before the challenge-response completes.
      */
     private suspend fun waitForAuthentication(timeout: Long = 10_000): Boolean {
-        val startTime = System.currentTimeMillis()
+        val startTime = elapsedMillis()
         val checkInterval = 100L
 
-        while (System.currentTimeMillis() - startTime < timeout) {
+        while (elapsedMillis() - startTime < timeout) {
             val currentState = authService.get().authState.value
             if (currentState is AuthState.Authenticated) {
                 return true
@@ -1394,9 +1396,9 @@ class CallService @Inject constructor(
 
     private fun handleTurnCredentials(frame: WsFrame<JsonElement>) {
         try {
-            val payload = gson.fromJson(frame.payload, TurnCredentialsPayload::class.java)
+            val payload = frame.payloadAs<TurnCredentialsPayload>(gson)
             _turnCredentials.value = payload
-            turnCredentialsReceivedAt = System.currentTimeMillis()
+            turnCredentialsReceivedAt = elapsedMillis()
             Logger.i("[CallService] TURN credentials received, TTL=${payload.ttl}s")
         } catch (e: Exception) {
             Logger.e("Failed to parse TURN credentials", e)
@@ -1409,7 +1411,7 @@ class CallService @Inject constructor(
      */
     private fun areTurnCredentialsValid(): Boolean {
         val creds = _turnCredentials.value ?: return false
-        val elapsedSeconds = (System.currentTimeMillis() - turnCredentialsReceivedAt) / 1000
+        val elapsedSeconds = (elapsedMillis() - turnCredentialsReceivedAt) / 1000
         val isValid = elapsedSeconds < (creds.ttl - 60)  // 60 second buffer before expiry
         if (!isValid) {
             Logger.i("[CallService] TURN credentials expired (elapsed=${elapsedSeconds}s, ttl=${creds.ttl}s)")
@@ -1434,7 +1436,7 @@ class CallService @Inject constructor(
                 Logger.e("[CallService] Manual JSON parsing failed, relying on Gson", e)
             }
 
-            val payload = gson.fromJson(frame.payload, CallIncomingPayload::class.java)
+            val payload = frame.payloadAs<CallIncomingPayload>(gson)
 
             // Combine parsed data safely
             val finalIsVideo = if (frame.payload.isJsonObject && frame.payload.asJsonObject.has("isVideo")) {
@@ -1491,7 +1493,7 @@ class CallService @Inject constructor(
     private fun handleCallAnswer(frame: WsFrame<JsonElement>) {
         try {
             // Server sends minimal payload: { callId, from, timestamp, nonce, ciphertext, sig }
-            val payload = gson.fromJson(frame.payload, CallAnswerNotificationPayload::class.java)
+            val payload = frame.payloadAs<CallAnswerNotificationPayload>(gson)
             val encPrivateKey = secureStorage.encPrivateKey ?: return
 
             Logger.d("Received call_answer: callId=${payload.callId}, from=${payload.from}")
@@ -1541,7 +1543,7 @@ class CallService @Inject constructor(
     private fun handleIceCandidate(frame: WsFrame<JsonElement>) {
         try {
             // Server sends minimal payload: { callId, from, timestamp, nonce, ciphertext, sig }
-            val payload = gson.fromJson(frame.payload, CallIceCandidateNotificationPayload::class.java)
+            val payload = frame.payloadAs<CallIceCandidateNotificationPayload>(gson)
             val encPrivateKey = secureStorage.encPrivateKey ?: return
 
             scope.launch {
@@ -1581,7 +1583,7 @@ class CallService @Inject constructor(
     private fun handleCallEnd(frame: WsFrame<JsonElement>) {
         try {
             // Server sends minimal payload: { callId, from, reason }
-            val payload = gson.fromJson(frame.payload, CallEndNotificationPayload::class.java)
+            val payload = frame.payloadAs<CallEndNotificationPayload>(gson)
             val reason = try {
                 CallEndReason.valueOf(payload.reason.uppercase())
             } catch (e: Exception) {
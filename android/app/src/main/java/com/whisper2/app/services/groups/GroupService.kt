@@ -148,6 +148,10 @@ class GroupService @Inject constructor(
     val groupEvents: SharedFlow<GroupEventPayload> = _groupEvents.asSharedFlow()
 
     init {
+        // Register our payload models so the WS read path decodes them once.
+        WsPayloadTypes.register(Constants.MsgType.GROUP_EVENT, GroupEventPayload::class.java)
+        WsPayloadTypes.register("group_message", GroupMessageReceivedPayload::class.java)
+        WsPayloadTypes.register("group_invite", GroupInvitePayload::class.java)
         setupMessageHandler()
     }
 
@@ -425,9 +429,9 @@ class GroupService @Inject constructor(
 
     private suspend fun handleMessage(frame: WsFrame<JsonElement>) {
         when (frame.type) {
-            Constants.MsgType.GROUP_EVENT -> handleGroupEvent(frame.payload)
-            "group_message" -> handleGroupMessage(frame.payload)
-            "group_invite" -> handleGroupInvite(frame.payload)
+            Constants.MsgType.GROUP_EVENT -> handleGroupEvent(frame)
+            "group_message" -> handleGroupMessage(frame)
+            "group_invite" -> handleGroupInvite(frame)
         }
     }
 
@@ -436,12 +440,12 @@ class GroupService @Inject constructor(
      * Called by MessageHandler when it finds a group_event in pending messages.
      */
     suspend fun handlePendingGroupEvent(payload: JsonElement) {
-        handleGroupEvent(payload)
+        handleGroupEvent(WsFrame(Constants.MsgType.GROUP_EVENT, payload = payload))
     }
 
-    private suspend fun handleGroupInvite(payload: JsonElement) {
+    private suspend fun handleGroupInvite(frame: WsFrame<JsonElement>) {
         try {
-            val invite = gson.fromJson(payload, GroupInvitePayload::class.java)
+            val invite = frame.payloadAs<GroupInvitePayload>(gson)
             Logger.i("[GroupService] Received group invite: ${invite.groupId} from ${invite.inviterName}")
 
             // Store the invite locally
@@ -459,9 +463,9 @@ class GroupService @Inject constructor(
         }
     }
 
-    private suspend fun handleGroupEvent(payload: JsonElement) {
+    private suspend fun handleGroupEvent(frame: WsFrame<JsonElement>) {
         try {
-            val event = gson.fromJson(payload, GroupEventPayload::class.java)
+            val event = frame.payloadAs<GroupEventPayload>(gson)
             val myId = secureStorage.whisperId ?: return
             val serverGroup = event.group
 
@@ -610,9 +614,9 @@ class GroupService @Inject constructor(
         }
     }
 
-    private suspend fun handleGroupMessage(payload: JsonElement) {
+    private suspend fun handleGroupMessage(frame: WsFrame<JsonElement>) {
         try {
-            val msg = gson.fromJson(payload, GroupMessageReceivedPayload::class.java)
+            val msg = frame.payloadAs<GroupMessageReceivedPayload>(gson)
             handleIncomingGroupMessagePayload(msg)
         } catch (e: Exception) {
             Logger.e("[GroupService] Failed to handle group message", e)
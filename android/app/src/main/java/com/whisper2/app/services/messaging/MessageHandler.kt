@@ -5,14 +5,18 @@ import android.app.PendingIntent
 import android.content.Context
 import android.content.Intent
 import android.util.Base64
+import android.util.LruCache
 import androidx.core.app.NotificationCompat
 import androidx.lifecycle.ProcessLifecycleOwner
+import androidx.room.withTransaction
 import com.google.gson.Gson
 import com.google.gson.JsonElement
 import com.whisper2.app.R
 import com.whisper2.app.core.Constants
 import com.whisper2.app.core.Logger
+import com.whisper2.app.core.elapsedMillis
 import com.whisper2.app.crypto.CryptoService
+import com.whisper2.app.data.local.db.WhisperDatabase
 import com.whisper2.app.data.local.db.dao.ContactDao
 import com.whisper2.app.data.local.db.dao.ConversationDao
 import com.whisper2.app.data.local.db.dao.MessageDao
@@ -26,9 +30,12 @@ import com.whisper2.app.ui.MainActivity
 import dagger.Lazy
 import dagger.hilt.android.qualifiers.ApplicationContext
 import kotlinx.coroutines.*
+import kotlinx.coroutines.channels.Channel
 import kotlinx.coroutines.flow.MutableSharedFlow
 import kotlinx.coroutines.flow.SharedFlow
 import kotlinx.coroutines.flow.asSharedFlow
+import kotlinx.coroutines.selects.onTimeout
+import kotlinx.coroutines.selects.select
 import javax.inject.Inject
 import javax.inject.Singleton
 
@@ -40,6 +47,7 @@ import javax.inject.Singleton
 class MessageHandler @Inject constructor(
     @ApplicationContext private val context: Context,
     private val wsClient: WsClientImpl,
+    private val db: WhisperDatabase,
     private val messageDao: MessageDao,
     private val conversationDao: ConversationDao,
     private val contactDao: ContactDao,
@@ -59,12 +67,54 @@ class MessageHandler @Inject constructor(
     private val _typingNotifications = MutableSharedFlow<TypingNotificationPayload>(extraBufferCapacity = 100)
     val typingNotifications: SharedFlow<TypingNotificationPayload> = _typingNotifications.asSharedFlow()
 
+    // Status updates are coalesced: receipts arrive one frame each, but a
+    // peer reading a conversation produces a burst, and a separate UPDATE +
+    // commit per receipt is one fsync each. The consumer drains a short
+    // window and issues one IN-list UPDATE per status.
+    private class StatusUpdate(val messageId: String, val status: String)
+    private val statusUpdates = Channel<StatusUpdate>(Channel.UNLIMITED)
+
     init {
         startListening()
+        scope.launch { statusUpdateLoop() }
         // Clear any stale typing indicators from previous sessions
         scope.launch {
             conversationDao.clearAllTyping()
-            Logger.d("[MessageHandler] Cleared all stale typing indicators")
+            Logger.d { "[MessageHandler] Cleared all stale typing indicators" }
+        }
+    }
+
+    private fun queueStatusUpdate(messageId: String, status: String) {
+        statusUpdates.trySend(StatusUpdate(messageId, status))
+    }
+
+    // The drain window uses select rather than withTimeoutOrNull around
+    // receive(): under prompt cancellation a receive that completes as the
+    // timeout fires takes the element and then throws, silently dropping
+    // that status update. select's onReceive only commits the element when
+    // the clause wins, so the window is lossless.
+    @OptIn(ExperimentalCoroutinesApi::class)
+    private suspend fun statusUpdateLoop() {
+        while (true) {
+            val batch = mutableListOf(statusUpdates.receive())
+            val deadline = elapsedMillis() + 50
+            var remaining = 50L
+            while (batch.size < 64 && remaining > 0) {
+                select<Unit> {
+                    statusUpdates.onReceive { batch.add(it) }
+                    onTimeout(remaining) { remaining = 0 }
+                }
+                if (remaining > 0) remaining = deadline - elapsedMillis()
+            }
+            try {
+                db.withTransaction {
+                    batch.groupBy({ it.status }, { it.messageId }).forEach { (status, ids) ->
+                        messageDao.updateStatusBatch(ids, status)
+                    }
+                }
+            } catch (e: Exception) {
+                Logger.e("[MessageHandler] Failed to apply status batch", e)
+            }
         }
     }
 
@@ -79,28 +129,28 @@ class MessageHandler @Inject constructor(
     private suspend fun handleFrame(frame: WsFrame<JsonElement>) {
         when (frame.type) {
             Constants.MsgType.MESSAGE_RECEIVED -> {
-                handleMessageReceived(frame.payload)
+                handleMessageReceived(frame)
             }
             Constants.MsgType.MESSAGE_ACCEPTED -> {
-                handleMessageAccepted(frame.payload)
+                handleMessageAccepted(frame)
             }
             Constants.MsgType.DELIVERY_RECEIPT -> {
-                handleDeliveryReceipt(frame.payload)
+                handleDeliveryReceipt(frame)
             }
             Constants.MsgType.PENDING_MESSAGES -> {
-                handlePendingMessages(frame.payload)
+                handlePendingMessages(frame)
             }
             Constants.MsgType.TYPING_NOTIFICATION -> {
-                handleTypingNotification(frame.payload)
+                handleTypingNotification(frame)
             }
             Constants.MsgType.MESSAGE_DELETED -> {
-                handleMessageDeleted(frame.payload)
+                handleMessageDeleted(frame)
             }
             Constants.MsgType.MESSAGE_DELIVERED -> {
-                handleMessageDelivered(frame.payload)
+                handleMessageDelivered(frame)
             }
             Constants.MsgType.PRESENCE_UPDATE -> {
-                handlePresenceUpdate(frame.payload)
+                handlePresenceUpdate(frame)
             }
         }
     }
@@ -109,10 +159,15 @@ class MessageHandler @Inject constructor(
      * Handle incoming message from another user.
      * Decrypt and store in database.
      */
-    private suspend fun handleMessageReceived(payload: JsonElement) {
+    private suspend fun handleMessageReceived(frame: WsFrame<JsonElement>) {
         try {
-            val msg = gson.fromJson(payload, MessageReceivedPayload::class.java)
-            Logger.d("[MessageHandler] Received message from ${msg.from}: ${msg.messageId}")
+            val msg = frame.payloadAs<MessageReceivedPayload>(gson)
+            Logger.d { "[MessageHandler] Received message from ${msg.from}: ${msg.messageId}" }
+
+            if (seenMessageIds.get(msg.messageId) != null) {
+                Logger.d { "[MessageHandler] Duplicate message, skipping: ${msg.messageId}" }
+                return
+            }
 
             val myId = secureStorage.whisperId ?: return
             val myPrivateKey = secureStorage.encPrivateKey ?: return
@@ -120,7 +175,7 @@ class MessageHandler @Inject constructor(
             // Check if sender is blocked
             val contact = contactDao.getContactById(msg.from)
             if (contact?.isBlocked == true) {
-                Logger.d("[MessageHandler] Ignoring message from blocked user: ${msg.from}")
+                Logger.d { "[MessageHandler] Ignoring message from blocked user: ${msg.from}" }
                 return
             }
 
@@ -153,6 +208,7 @@ class MessageHandler @Inject constructor(
 
             // Store message
             messageDao.insert(message)
+            seenMessageIds.put(msg.messageId, true)
 
             // Update conversation (only for 1:1 messages, group messages are handled by GroupService)
             if (msg.groupId == null) {
@@ -178,7 +234,7 @@ class MessageHandler @Inject constructor(
                 autoDownloadAttachment(msg.messageId, msg.attachment, contact.encPublicKey)
             }
 
-            Logger.d("[MessageHandler] Message processed: ${msg.messageId}")
+            Logger.d { "[MessageHandler] Message processed: ${msg.messageId}" }
 
         } catch (e: Exception) {
             Logger.e("[MessageHandler] Failed to process message", e)
@@ -198,7 +254,7 @@ class MessageHandler @Inject constructor(
 
             // If no contact, check if sender's keys are in the message payload
             if (senderPubKeyBase64 == null && msg.senderEncPublicKey != null) {
-                Logger.d("[MessageHandler] Using sender's public key from message payload")
+                Logger.d { "[MessageHandler] Using sender's public key from message payload" }
                 senderPubKeyBase64 = msg.senderEncPublicKey
 
                 // Auto-add sender as a contact with provided keys (message request accepted)
@@ -240,7 +296,7 @@ class MessageHandler @Inject constructor(
                     msg.senderSignPublicKey?.let {
                         contactDao.updateSignPublicKey(msg.from, it)
                     }
-                    Logger.d("[MessageHandler] Updated contact keys for ${msg.from}")
+                    Logger.d { "[MessageHandler] Updated contact keys for ${msg.from}" }
                 }
                 return
             }
@@ -253,7 +309,7 @@ class MessageHandler @Inject constructor(
                 signPublicKey = msg.senderSignPublicKey
             )
             contactDao.insert(newContact)
-            Logger.d("[MessageHandler] Added contact from message request: ${msg.from}")
+            Logger.d { "[MessageHandler] Added contact from message request: ${msg.from}" }
         } catch (e: Exception) {
             Logger.e("[MessageHandler] Failed to add contact from message request", e)
         }
@@ -291,7 +347,7 @@ class MessageHandler @Inject constructor(
             try {
                 // For "read" status, check privacy setting
                 if (status == Constants.DeliveryStatus.READ && !secureStorage.sendReadReceipts) {
-                    Logger.d("[MessageHandler] Read receipts disabled in privacy settings")
+                    Logger.d { "[MessageHandler] Read receipts disabled in privacy settings" }
                     return@launch
                 }
 
@@ -307,7 +363,7 @@ class MessageHandler @Inject constructor(
                     timestamp = System.currentTimeMillis()
                 )
                 wsClient.send(WsFrame(Constants.MsgType.DELIVERY_RECEIPT, payload = payload))
-                Logger.d("[MessageHandler] Sent $status receipt for $messageId")
+                Logger.d { "[MessageHandler] Sent $status receipt for $messageId" }
             } catch (e: Exception) {
                 Logger.e("[MessageHandler] Failed to send delivery receipt", e)
             }
@@ -321,7 +377,7 @@ class MessageHandler @Inject constructor(
      */
     fun sendReadReceipt(messageId: String, senderId: String) {
         if (!secureStorage.sendReadReceipts) {
-            Logger.d("[MessageHandler] Read receipts disabled in privacy settings")
+            Logger.d { "[MessageHandler] Read receipts disabled in privacy settings" }
             return
         }
         sendDeliveryReceipt(messageId, senderId, Constants.DeliveryStatus.READ)
@@ -362,13 +418,13 @@ class MessageHandler @Inject constructor(
     /**
      * Handle acknowledgment that our sent message was accepted by server.
      */
-    private suspend fun handleMessageAccepted(payload: JsonElement) {
+    private suspend fun handleMessageAccepted(frame: WsFrame<JsonElement>) {
         try {
-            val data = gson.fromJson(payload, MessageAcceptedPayload::class.java)
-            Logger.d("[MessageHandler] Message accepted: ${data.messageId}")
+            val data = frame.payloadAs<MessageAcceptedPayload>(gson)
+            Logger.d { "[MessageHandler] Message accepted: ${data.messageId}" }
 
             // Update message status to "sent"
-            messageDao.updateStatus(data.messageId, "sent")
+            queueStatusUpdate(data.messageId, "sent")
         } catch (e: Exception) {
             Logger.e("[MessageHandler] Failed to handle message accepted", e)
         }
@@ -377,13 +433,13 @@ class MessageHandler @Inject constructor(
     /**
      * Handle delivery/read receipts from recipients.
      */
-    private suspend fun handleDeliveryReceipt(payload: JsonElement) {
+    private suspend fun handleDeliveryReceipt(frame: WsFrame<JsonElement>) {
         try {
-            val receipt = gson.fromJson(payload, DeliveryReceiptPayload::class.java)
-            Logger.d("[MessageHandler] Receipt for ${receipt.messageId}: ${receipt.status}")
+            val receipt = frame.payloadAs<DeliveryReceiptPayload>(gson)
+            Logger.d { "[MessageHandler] Receipt for ${receipt.messageId}: ${receipt.status}" }
 
             // Update message status
-            messageDao.updateStatus(receipt.messageId, receipt.status)
+            queueStatusUpdate(receipt.messageId, receipt.status)
         } catch (e: Exception) {
             Logger.e("[MessageHandler] Failed to handle delivery receipt", e)
         }
@@ -394,29 +450,36 @@ class MessageHandler @Inject constructor(
      * Pending queue can contain different types: message_received, group_event, etc.
      * Route each item to the appropriate handler based on its type.
      */
-    private suspend fun handlePendingMessages(payload: JsonElement) {
+    private suspend fun handlePendingMessages(frame: WsFrame<JsonElement>) {
         try {
-            val data = gson.fromJson(payload, PendingMessagesPayload::class.java)
-            Logger.d("[MessageHandler] Received ${data.messages.size} pending items")
-
-            data.messages.forEach { item ->
-                try {
-                    // Check the type field to route to the correct handler
-                    val type = item.asJsonObject?.get("type")?.asString
-
-                    when (type) {
-                        Constants.MsgType.GROUP_EVENT, "group_event" -> {
-                            // Route group events to GroupService
-                            Logger.d("[MessageHandler] Routing pending group_event to GroupService")
-                            groupService.get().handlePendingGroupEvent(item)
-                        }
-                        else -> {
-                            // Treat as regular message (message_received is the default)
-                            handleMessageReceived(item)
+            val data = frame.payloadAs<PendingMessagesPayload>(gson)
+            Logger.d { "[MessageHandler] Received ${data.messages.size} pending items" }
+
+            // One transaction for the whole replay: a reconnect after a day
+            // offline can bring hundreds of items, and committing each insert
+            // separately means one fsync per message.
+            db.withTransaction {
+                data.messages.forEach { item ->
+                    try {
+                        // Check the type field to route to the correct handler
+                        val type = item.asJsonObject?.get("type")?.asString
+
+                        when (type) {
+                            Constants.MsgType.GROUP_EVENT, "group_event" -> {
+                                // Route group events to GroupService
+                                Logger.d { "[MessageHandler] Routing pending group_event to GroupService" }
+                                groupService.get().handlePendingGroupEvent(item)
+                            }
+                            else -> {
+                                // Treat as regular message (message_received is the default).
+                                // Pending items arrive payload-shaped, so wrap them in a
+                                // frame envelope; payloadAs parses them on demand.
+                                handleMessageReceived(WsFrame(Constants.MsgType.MESSAGE_RECEIVED, payload = item))
+                            }
                         }
+                    } catch (e: Exception) {
+                        Logger.e("[MessageHandler] Failed to process pending item", e)
                     }
-                } catch (e: Exception) {
-                    Logger.e("[MessageHandler] Failed to process pending item", e)
                 }
             }
         } catch (e: Exception) {
@@ -427,13 +490,19 @@ class MessageHandler @Inject constructor(
     // Track typing timeout jobs per user
     private val typingTimeoutJobs = mutableMapOf<String, Job>()
 
+    // Recently processed messageIds. The FCM+WS race and the pending-queue
+    // replay can hand us the same message twice; insert() is REPLACE so
+    // correctness never depended on deduping, but this skips the repeat
+    // decrypt + DB round-trip and the duplicate notification.
+    private val seenMessageIds = LruCache<String, Boolean>(512)
+
     /**
      * Handle typing notification from another user.
      */
-    private suspend fun handleTypingNotification(payload: JsonElement) {
+    private suspend fun handleTypingNotification(frame: WsFrame<JsonElement>) {
         try {
-            val notification = gson.fromJson(payload, TypingNotificationPayload::class.java)
-            Logger.d("[MessageHandler] Typing notification from ${notification.from}: ${notification.isTyping}")
+            val notification = frame.payloadAs<TypingNotificationPayload>(gson)
+            Logger.d { "[MessageHandler] Typing notification from ${notification.from}: ${notification.isTyping}" }
 
             // Update database so ChatsListScreen shows typing indicator
             conversationDao.setTyping(notification.from, notification.isTyping)
@@ -448,7 +517,7 @@ class MessageHandler @Inject constructor(
                     conversationDao.setTyping(notification.from, false)
                     // Also emit to clear in ChatViewModel
                     _typingNotifications.emit(TypingNotificationPayload(notification.from, false))
-                    Logger.d("[MessageHandler] Auto-cleared typing for ${notification.from}")
+                    Logger.d { "[MessageHandler] Auto-cleared typing for ${notification.from}" }
                 }
             }
 
@@ -463,15 +532,15 @@ class MessageHandler @Inject constructor(
      * Handle message deleted notification from server.
      * Server sends this when someone deletes a message for everyone.
      */
-    private suspend fun handleMessageDeleted(payload: JsonElement) {
+    private suspend fun handleMessageDeleted(frame: WsFrame<JsonElement>) {
         try {
-            val data = gson.fromJson(payload, MessageDeletedPayload::class.java)
-            Logger.d("[MessageHandler] Message deleted: ${data.messageId} by ${data.deletedBy}")
+            val data = frame.payloadAs<MessageDeletedPayload>(gson)
+            Logger.d { "[MessageHandler] Message deleted: ${data.messageId} by ${data.deletedBy}" }
 
             if (data.deleteForEveryone) {
                 // Delete message from local database
                 messageDao.deleteById(data.messageId)
-                Logger.d("[MessageHandler] Deleted message ${data.messageId} from database")
+                Logger.d { "[MessageHandler] Deleted message ${data.messageId} from database" }
             }
         } catch (e: Exception) {
             Logger.e("[MessageHandler] Failed to handle message deleted", e)
@@ -482,13 +551,13 @@ class MessageHandler @Inject constructor(
      * Handle message delivered notification from server.
      * Server sends this to sender when recipient confirms delivery.
      */
-    private suspend fun handleMessageDelivered(payload: JsonElement) {
+    private suspend fun handleMessageDelivered(frame: WsFrame<JsonElement>) {
         try {
-            val data = gson.fromJson(payload, MessageDeliveredPayload::class.java)
-            Logger.d("[MessageHandler] Message delivered: ${data.messageId} status=${data.status}")
+            val data = frame.payloadAs<MessageDeliveredPayload>(gson)
+            Logger.d { "[MessageHandler] Message delivered: ${data.messageId} status=${data.status}" }
 
             // Update message status in database
-            messageDao.updateStatus(data.messageId, data.status)
+            queueStatusUpdate(data.messageId, data.status)
         } catch (e: Exception) {
             Logger.e("[MessageHandler] Failed to handle message delivered", e)
         }
@@ -498,10 +567,10 @@ class MessageHandler @Inject constructor(
      * Handle presence update notification from server.
      * Updates contact's online status and last seen timestamp.
      */
-    private suspend fun handlePresenceUpdate(payload: JsonElement) {
+    private suspend fun handlePresenceUpdate(frame: WsFrame<JsonElement>) {
         try {
-            val data = gson.fromJson(payload, PresenceUpdatePayload::class.java)
-            Logger.d("[MessageHandler] Presence update: ${data.whisperId} is ${data.status}")
+            val data = frame.payloadAs<PresenceUpdatePayload>(gson)
+            Logger.d { "[MessageHandler] Presence update: ${data.whisperId} is ${data.status}" }
 
             // Update contact's presence status
             val isOnline = data.status == Constants.PresenceStatus.ONLINE
@@ -527,7 +596,7 @@ class MessageHandler @Inject constructor(
                     type = Constants.MsgType.FETCH_PENDING,
                     payload = payload
                 ))
-                Logger.d("[MessageHandler] Requested pending messages")
+                Logger.d { "[MessageHandler] Requested pending messages" }
             } catch (e: Exception) {
                 Logger.e("[MessageHandler] Failed to fetch pending messages", e)
             }
@@ -546,7 +615,7 @@ class MessageHandler @Inject constructor(
             )
 
             if (isAppInForeground) {
-                Logger.d("[MessageHandler] App in foreground, skipping notification")
+                Logger.d { "[MessageHandler] App in foreground, skipping notification" }
                 return
             }
 
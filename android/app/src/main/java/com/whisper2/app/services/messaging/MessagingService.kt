@@ -17,6 +17,8 @@ import com.whisper2.app.data.network.ws.*
 import com.whisper2.app.services.attachments.AttachmentService
 import dagger.hilt.android.qualifiers.ApplicationContext
 import kotlinx.coroutines.*
+import kotlinx.coroutines.flow.collect
+import kotlinx.coroutines.flow.takeWhile
 import java.util.UUID
 import javax.inject.Inject
 import javax.inject.Singleton
@@ -140,11 +142,11 @@ class MessagingService @Inject constructor(
             // Send via WebSocket
             if (wsClient.connectionState.value == WsConnectionState.CONNECTED) {
                 wsClient.send(WsFrame(Constants.MsgType.SEND_MESSAGE, payload = payload))
-                Logger.d("[MessagingService] Sent message: $messageId")
+                Logger.d { "[MessagingService] Sent message: $messageId" }
             } else {
                 // Queue for later
                 queueMessage(messageId, peerId, msgType, content)
-                Logger.d("[MessagingService] Queued message: $messageId (not connected)")
+                Logger.d { "[MessagingService] Queued message: $messageId (not connected)" }
             }
 
         } catch (e: Exception) {
@@ -162,7 +164,7 @@ class MessagingService @Inject constructor(
 
         // Copy audio to persistent storage
         val persistentPath = copyAudioToPersistentStorage(audioPath, messageId)
-        Logger.d("[MessagingService] Audio copied to persistent storage: $persistentPath")
+        Logger.d { "[MessagingService] Audio copied to persistent storage: $persistentPath" }
 
         val message = MessageEntity(
             id = messageId,
@@ -194,7 +196,7 @@ class MessagingService @Inject constructor(
 
             // Upload encrypted audio file from persistent storage
             val attachmentPointer = attachmentService.uploadAttachment(persistentPath, recipientPubKey)
-            Logger.d("[MessagingService] Audio uploaded: ${attachmentPointer.objectKey}")
+            Logger.d { "[MessagingService] Audio uploaded: ${attachmentPointer.objectKey}" }
 
             // Send message with attachment pointer - content is duration in seconds (iOS format)
             sendEncryptedMessage(
@@ -258,9 +260,7 @@ class MessagingService @Inject constructor(
             content = locationJson,
             timestamp = System.currentTimeMillis(),
             status = Constants.MessageStatus.PENDING,
-            direction = Constants.Direction.OUTGOING,
-            locationLatitude = latitude,
-            locationLongitude = longitude
+            direction = Constants.Direction.OUTGOING
         )
 
         messageDao.insert(message)
@@ -284,7 +284,7 @@ class MessagingService @Inject constructor(
 
         // Copy file to persistent storage (content:// URIs become invalid after picker closes)
         val persistentPath = copyToPersistentStorage(contentUri, messageId, mimeType)
-        Logger.d("[MessagingService] Copied to persistent storage: $persistentPath")
+        Logger.d { "[MessagingService] Copied to persistent storage: $persistentPath" }
 
         val message = MessageEntity(
             id = messageId,
@@ -316,7 +316,7 @@ class MessagingService @Inject constructor(
             // Upload encrypted file from persistent storage
             val persistentUri = android.net.Uri.fromFile(java.io.File(persistentPath))
             val attachmentPointer = attachmentService.uploadAttachment(persistentUri, recipientPubKey)
-            Logger.d("[MessagingService] File uploaded: ${attachmentPointer.objectKey}")
+            Logger.d { "[MessagingService] File uploaded: ${attachmentPointer.objectKey}" }
 
             // Send message with attachment pointer - use detected content type
             sendEncryptedMessage(
@@ -371,18 +371,22 @@ class MessagingService @Inject constructor(
      * Process queued outbox messages (called after reconnect).
      */
     suspend fun processOutbox() {
-        val pending = outboxDao.getPending()
-        Logger.d("[MessagingService] Processing ${pending.size} queued messages")
-
-        pending.forEach { outbox ->
-            sendEncryptedMessage(
-                messageId = outbox.messageId,
-                peerId = outbox.to,
-                msgType = outbox.msgType,
-                content = outbox.encryptedPayload  // This is actually plaintext content
-            )
-            outboxDao.delete(outbox.messageId)
-        }
+        // Drain in windows: each delete re-emits the next batch, and the
+        // first empty emission ends the collection.
+        outboxDao.getPending()
+            .takeWhile { it.isNotEmpty() }
+            .collect { pending ->
+                Logger.d { "[MessagingService] Processing ${pending.size} queued messages" }
+                pending.forEach { outbox ->
+                    sendEncryptedMessage(
+                        messageId = outbox.messageId,
+                        peerId = outbox.to,
+                        msgType = outbox.msgType,
+                        content = outbox.encryptedPayload  // This is actually plaintext content
+                    )
+                    outboxDao.delete(outbox.messageId)
+                }
+            }
     }
 
     private suspend fun updateConversation(peerId: String, preview: String) {
@@ -424,7 +428,7 @@ class MessagingService @Inject constructor(
         try {
             // Check privacy setting - don't send if disabled
             if (!secureStorage.showTypingIndicator) {
-                Logger.d("[MessagingService] Typing indicator disabled in privacy settings")
+                Logger.d { "[MessagingService] Typing indicator disabled in privacy settings" }
                 return
             }
 
@@ -478,7 +482,7 @@ class MessagingService @Inject constructor(
                     type = Constants.MsgType.DELETE_MESSAGE,
                     payload = payload
                 ))
-                Logger.d("[MessagingService] Sent delete request for $messageId")
+                Logger.d { "[MessagingService] Sent delete request for $messageId" }
 
                 // Delete locally
                 if (!forEveryone) {
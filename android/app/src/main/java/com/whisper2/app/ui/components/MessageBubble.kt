@@ -401,19 +401,12 @@ private fun VoiceMessageContent(
 private fun LocationMessageContent(message: MessageEntity, isOutgoing: Boolean) {
     val context = LocalContext.current
 
-    // Get coordinates from message
-    val latitude = message.locationLatitude ?: run {
-        // Try parsing from JSON content
+    // Coordinates live in the content JSON (same shape as iOS); parse once
+    val (latitude, longitude) = remember(message.content) {
         try {
             val json = org.json.JSONObject(message.content)
-            json.optDouble("latitude", 0.0)
-        } catch (e: Exception) { 0.0 }
-    }
-    val longitude = message.locationLongitude ?: run {
-        try {
-            val json = org.json.JSONObject(message.content)
-            json.optDouble("longitude", 0.0)
-        } catch (e: Exception) { 0.0 }
+            json.optDouble("latitude", 0.0) to json.optDouble("longitude", 0.0)
+        } catch (e: Exception) { 0.0 to 0.0 }
     }
 
     Column(
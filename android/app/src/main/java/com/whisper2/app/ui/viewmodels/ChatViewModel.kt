@@ -3,6 +3,10 @@ package com.whisper2.app.ui.viewmodels
 import android.util.Base64
 import androidx.lifecycle.ViewModel
 import androidx.lifecycle.viewModelScope
+import androidx.paging.Pager
+import androidx.paging.PagingConfig
+import androidx.paging.PagingData
+import androidx.paging.cachedIn
 import com.whisper2.app.core.Logger
 import com.whisper2.app.data.local.db.dao.ContactDao
 import com.whisper2.app.data.local.db.dao.ConversationDao
@@ -41,6 +45,18 @@ class ChatViewModel @Inject constructor(
         .flatMapLatest { messageDao.getMessagesForConversation(it) }
         .stateIn(viewModelScope, SharingStarted.WhileSubscribed(5000), emptyList())
 
+    // Paged history, newest first. Peak memory stays at one page no
+    // matter how long the conversation is; the screen collects this via
+    // collectAsLazyPagingItems.
+    val pagedMessages: Flow<PagingData<MessageEntity>> = _peerId
+        .filter { it.isNotEmpty() }
+        .flatMapLatest { peerId ->
+            Pager(PagingConfig(pageSize = 40, enablePlaceholders = false)) {
+                messageDao.getMessagesPaged(peerId)
+            }.flow
+        }
+        .cachedIn(viewModelScope)
+
     val contactName: StateFlow<String> = _peerId
         .filter { it.isNotEmpty() }
         .flatMapLatest { peerId ->
@@ -0,0 +1,35 @@
+# Whisper2 ProGuard Rules
+
+# Lazysodium + JNA (CRITICAL for crypto)
+-keep class com.sun.jna.** { *; }
+-keep class * implements com.sun.jna.** { *; }
+-keepclassmembers class * extends com.sun.jna.** { public *; }
+-keep class com.goterl.lazysodium.** { *; }
+-keepclasseswithmembernames class * { native <methods>; }
+
+# Retrofit + OkHttp
+-dontwarn okhttp3.**
+-dontwarn okio.**
+-keep class okhttp3.** { *; }
+-keep class okio.** { *; }
+-keepattributes Signature, Exceptions, *Annotation*
+-keep class retrofit2.** { *; }
+-keepclasseswithmembers class * { @retrofit2.http.* <methods>; }
+
+# Gson
+-keep class com.google.gson.** { *; }
+-keep class com.whisper2.app.data.network.ws.** { *; }
+-keep class com.whisper2.app.data.network.api.** { *; }
+-keep class com.whisper2.app.domain.model.** { *; }
+
+# Room
+-keep class * extends androidx.room.RoomDatabase
+-keep @androidx.room.Entity class *
+-keepclassmembers @androidx.room.Entity class * { *; }
+
+# WebRTC
+-keep class org.webrtc.** { *; }
+
+# Kotlin
+-keep class kotlin.Metadata { *; }
+-keepclassmembers class kotlin.Metadata { public <methods>; }
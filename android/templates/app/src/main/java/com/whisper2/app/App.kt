@@ -0,0 +1,49 @@
+package com.whisper2.app
+
+import android.app.Application
+import android.app.NotificationChannel
+import android.app.NotificationManager
+import android.os.Build
+import com.whisper2.app.core.Logger
+import dagger.hilt.android.HiltAndroidApp
+
+@HiltAndroidApp
+class App : Application() {
+
+    override fun onCreate() {
+        super.onCreate()
+        Logger.info("Whisper2 Application starting")
+        createNotificationChannels()
+    }
+
+    private fun createNotificationChannels() {
+        if (Build.VERSION.SDK_INT >= Build.VERSION_CODES.O) {
+            val notificationManager = getSystemService(NotificationManager::class.java)
+
+            val messagesChannel = NotificationChannel(
+                CHANNEL_MESSAGES,
+                getString(R.string.notification_channel_messages),
+                NotificationManager.IMPORTANCE_HIGH
+            ).apply {
+                enableVibration(true)
+                enableLights(true)
+            }
+
+            val callsChannel = NotificationChannel(
+                CHANNEL_CALLS,
+                getString(R.string.notification_channel_calls),
+                NotificationManager.IMPORTANCE_MAX
+            ).apply {
+                enableVibration(true)
+                setSound(null, null)
+            }
+
+            notificationManager.createNotificationChannels(listOf(messagesChannel, callsChannel))
+        }
+    }
+
+    companion object {
+        const val CHANNEL_MESSAGES = "whisper2_messages"
+        const val CHANNEL_CALLS = "whisper2_calls"
+    }
+}
@@ -0,0 +1,139 @@
+package com.whisper2.app.core
+
+/**
+ * FROZEN CONSTANTS - DO NOT MODIFY
+ * Must match server and iOS client exactly.
+ */
+object Constants {
+
+    // Server
+    const val WS_URL = "wss://whisper2.aiakademiturkiye.com/ws"
+    const val BASE_URL = "https://whisper2.aiakademiturkiye.com"
+
+    // Protocol
+    const val PROTOCOL_VERSION = 1
+    const val CRYPTO_VERSION = 1
+
+    // Crypto (FROZEN)
+    const val BIP39_SEED_LENGTH = 64
+    const val BIP39_ITERATIONS = 2048
+    const val BIP39_SALT = "mnemonic"
+    const val HKDF_SALT = "whisper"
+    const val ENCRYPTION_DOMAIN = "whisper/enc"
+    const val SIGNING_DOMAIN = "whisper/sign"
+    const val CONTACTS_DOMAIN = "whisper/contacts"
+
+    // NaCl sizes
+    const val NACL_NONCE_SIZE = 24
+    const val NACL_KEY_SIZE = 32
+    const val NACL_PUBLIC_KEY_SIZE = 32
+    const val NACL_SECRET_KEY_SIZE = 32
+    const val NACL_SIGN_SECRET_KEY_SIZE = 64
+    const val NACL_SIGNATURE_SIZE = 64
+    const val NACL_BOX_MAC_SIZE = 16
+
+    // Limits
+    const val TIMESTAMP_SKEW_MS = 10 * 60 * 1000L
+    const val SESSION_TTL_DAYS = 7
+    const val MAX_GROUP_MEMBERS = 50
+    const val MAX_GROUP_TITLE = 64
+    const val MAX_ATTACHMENT_SIZE = 100 * 1024 * 1024L
+    const val MAX_BACKUP_SIZE = 256 * 1024
+    const val MAX_MESSAGE_SIZE = 64 * 1024
+
+    // Timing
+    const val HEARTBEAT_INTERVAL_MS = 30_000L
+    const val RECONNECT_BASE_DELAY_MS = 1000L
+    const val RECONNECT_MAX_DELAY_MS = 30_000L
+    const val RECONNECT_MAX_ATTEMPTS = 5
+    const val CALL_RING_TIMEOUT_MS = 30_000L
+
+    // Message Types
+    object MsgType {
+        const val REGISTER_BEGIN = "register_begin"
+        const val REGISTER_CHALLENGE = "register_challenge"
+        const val REGISTER_PROOF = "register_proof"
+        const val REGISTER_ACK = "register_ack"
+        const val SEND_MESSAGE = "send_message"
+        const val MESSAGE_RECEIVED = "message_received"
+        const val MESSAGE_ACCEPTED = "message_accepted"
+        const val MESSAGE_DELIVERED = "message_delivered"
+        const val DELIVERY_RECEIPT = "delivery_receipt"
+        const val FETCH_PENDING = "fetch_pending"
+        const val PENDING_MESSAGES = "pending_messages"
+        const val TYPING_INDICATOR = "typing_indicator"
+        const val CALL_INITIATE = "call_initiate"
+        const val CALL_INCOMING = "call_incoming"
+        const val CALL_ANSWER = "call_answer"
+        const val CALL_RINGING = "call_ringing"
+        const val CALL_ICE_CANDIDATE = "call_ice_candidate"
+        const val CALL_END = "call_end"
+        const val GET_TURN_CREDENTIALS = "get_turn_credentials"
+        const val TURN_CREDENTIALS = "turn_credentials"
+        const val GROUP_CREATE = "group_create"
+        const val GROUP_CREATED = "group_created"
+        const val GROUP_UPDATE = "group_update"
+        const val GROUP_EVENT = "group_event"
+        const val GROUP_SEND_MESSAGE = "group_send_message"
+        const val GROUP_MESSAGE_RECEIVED = "group_message_received"
+        const val UPDATE_TOKENS = "update_tokens"
+        const val TOKENS_UPDATED = "tokens_updated"
+        const val SESSION_REFRESH = "session_refresh"
+        const val SESSION_REFRESH_ACK = "session_refresh_ack"
+        const val PING = "ping"
+        const val PONG = "pong"
+        const val ERROR = "error"
+    }
+
+    object ContentType {
+        const val TEXT = "text"
+        const val IMAGE = "image"
+        const val AUDIO = "audio"
+        const val FILE = "file"
+        const val LOCATION = "location"
+    }
+
+    object ErrorCode {
+        const val NOT_REGISTERED = "NOT_REGISTERED"
+        const val AUTH_FAILED = "AUTH_FAILED"
+        const val INVALID_PAYLOAD = "INVALID_PAYLOAD"
+        const val INVALID_TIMESTAMP = "INVALID_TIMESTAMP"
+        const val INVALID_SIGNATURE = "INVALID_SIGNATURE"
+        const val RATE_LIMITED = "RATE_LIMITED"
+        const val USER_NOT_FOUND = "USER_NOT_FOUND"
+        const val SESSION_EXPIRED = "SESSION_EXPIRED"
+        const val BLOCKED = "BLOCKED"
+    }
+
+    object CallEndReason {
+        const val ENDED = "ended"
+        const val DECLINED = "declined"
+        const val BUSY = "busy"
+        const val NO_ANSWER = "no_answer"
+        const val NETWORK_ERROR = "network_error"
+    }
+
+    object MessageStatus {
+        const val PENDING = "pending"
+        const val SENDING = "sending"
+        const val SENT = "sent"
+        const val DELIVERED = "delivered"
+        const val READ = "read"
+        const val FAILED = "failed"
+    }
+
+    object Direction {
+        const val INCOMING = "incoming"
+        const val OUTGOING = "outgoing"
+    }
+
+    // Storage
+    const val DATABASE_NAME = "whisper2_db"
+    const val SECURE_PREFS_NAME = "whisper2_secure_prefs"
+    const val KEYSTORE_ALIAS = "whisper2_wrapper_key"
+    const val ATTACHMENT_CACHE_DIR = "attachments"
+    const val MAX_MEMORY_CACHE_SIZE = 50 * 1024 * 1024
+    const val MAX_DISK_CACHE_SIZE = 500 * 1024 * 1024L
+
+    const val PLATFORM = "android"
+}
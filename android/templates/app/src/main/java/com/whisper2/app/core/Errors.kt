@@ -0,0 +1,36 @@
+package com.whisper2.app.core
+
+sealed class CryptoException(message: String, cause: Throwable? = null) : Exception(message, cause)
+class InvalidMnemonicException(message: String = "Invalid mnemonic phrase") : CryptoException(message)
+class KeyDerivationException(message: String, cause: Throwable? = null) : CryptoException(message, cause)
+class EncryptionException(message: String, cause: Throwable? = null) : CryptoException(message, cause)
+class DecryptionException(message: String = "Decryption failed") : CryptoException(message)
+class SignatureVerificationException(message: String = "Invalid signature") : CryptoException(message)
+
+sealed class ProtocolException(message: String, val errorCode: String? = null) : Exception(message)
+class TimestampValidationException(message: String = "Timestamp outside valid window") : ProtocolException(message, Constants.ErrorCode.INVALID_TIMESTAMP)
+class AuthenticationException(message: String = "Authentication failed", errorCode: String = Constants.ErrorCode.AUTH_FAILED) : ProtocolException(message, errorCode)
+class SessionExpiredException(message: String = "Session expired") : ProtocolException(message, Constants.ErrorCode.SESSION_EXPIRED)
+class UserNotFoundException(whisperId: String) : ProtocolException("User not found: $whisperId", Constants.ErrorCode.USER_NOT_FOUND)
+class UserBlockedException(whisperId: String) : ProtocolException("User is blocked: $whisperId", Constants.ErrorCode.BLOCKED)
+class RateLimitedException(message: String = "Rate limited") : ProtocolException(message, Constants.ErrorCode.RATE_LIMITED)
+class InvalidPayloadException(message: String = "Invalid payload") : ProtocolException(message, Constants.ErrorCode.INVALID_PAYLOAD)
+
+sealed class NetworkException(message: String, cause: Throwable? = null) : Exception(message, cause)
+class WebSocketConnectionException(message: String = "WebSocket connection failed", cause: Throwable? = null) : NetworkException(message, cause)
+class WebSocketDisconnectedException(message: String = "WebSocket disconnected") : NetworkException(message)
+class HttpException(val statusCode: Int, message: String) : NetworkException("HTTP $statusCode: $message")
+
+sealed class StorageException(message: String, cause: Throwable? = null) : Exception(message, cause)
+class SecureStorageException(message: String, cause: Throwable? = null) : StorageException(message, cause)
+class DatabaseException(message: String, cause: Throwable? = null) : StorageException(message, cause)
+
+sealed class AttachmentException(message: String, cause: Throwable? = null) : Exception(message, cause)
+class AttachmentTooLargeException(size: Long, maxSize: Long = Constants.MAX_ATTACHMENT_SIZE) : AttachmentException("Attachment size ($size) exceeds max ($maxSize)")
+class AttachmentUploadException(message: String, cause: Throwable? = null) : AttachmentException(message, cause)
+class AttachmentDownloadException(message: String, cause: Throwable? = null) : AttachmentException(message, cause)
+
+sealed class CallException(message: String) : Exception(message)
+class CallInitiationException(message: String = "Failed to initiate call") : CallException(message)
+class CallRejectedException(reason: String) : CallException("Call rejected: $reason")
+class WebRtcException(message: String) : CallException(message)
@@ -0,0 +1,31 @@
+package com.whisper2.app.core
+
+import android.util.Log
+import com.whisper2.app.BuildConfig
+
+object Logger {
+    private const val TAG = "Whisper2"
+    private val isDebug = BuildConfig.DEBUG
+
+    fun debug(message: String, tag: String = TAG) {
+        if (isDebug) Log.d(tag, message)
+    }
+
+    fun info(message: String, tag: String = TAG) = Log.i(tag, message)
+    fun warn(message: String, tag: String = TAG) = Log.w(tag, message)
+
+    fun error(message: String, throwable: Throwable? = null, tag: String = TAG) {
+        if (throwable != null) Log.e(tag, message, throwable)
+        else Log.e(tag, message)
+    }
+
+    fun ws(message: String) = debug("[WS] $message", "Whisper2-WS")
+    fun crypto(message: String) { if (isDebug) debug("[CRYPTO] $message", "Whisper2-Crypto") }
+    fun auth(message: String) = debug("[AUTH] $message", "Whisper2-Auth")
+    fun call(message: String) = debug("[CALL] $message", "Whisper2-Call")
+
+    fun redact(value: String): String {
+        if (value.length <= 8) return "[REDACTED]"
+        return if (isDebug) "${value.take(4)}...${value.takeLast(4)}" else "[REDACTED]"
+    }
+}
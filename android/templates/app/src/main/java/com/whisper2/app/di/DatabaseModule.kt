@@ -0,0 +1,31 @@
+package com.whisper2.app.di
+
+import android.content.Context
+import androidx.room.Room
+import com.whisper2.app.core.Constants
+import com.whisper2.app.data.local.db.WhisperDatabase
+import com.whisper2.app.data.local.db.dao.*
+import dagger.Module
+import dagger.Provides
+import dagger.hilt.InstallIn
+import dagger.hilt.android.qualifiers.ApplicationContext
+import dagger.hilt.components.SingletonComponent
+import javax.inject.Singleton
+
+@Module
+@InstallIn(SingletonComponent::class)
+object DatabaseModule {
+
+    @Provides @Singleton
+    fun provideDatabase(@ApplicationContext context: Context): WhisperDatabase =
+        Room.databaseBuilder(context, WhisperDatabase::class.java, Constants.DATABASE_NAME)
+            .fallbackToDestructiveMigration()
+            .build()
+
+    @Provides fun provideMessageDao(db: WhisperDatabase): MessageDao = db.messageDao()
+    @Provides fun provideConversationDao(db: WhisperDatabase): ConversationDao = db.conversationDao()
+    @Provides fun provideContactDao(db: WhisperDatabase): ContactDao = db.contactDao()
+    @Provides fun provideGroupDao(db: WhisperDatabase): GroupDao = db.groupDao()
+    @Provides fun provideOutboxDao(db: WhisperDatabase): OutboxDao = db.outboxDao()
+    @Provides fun provideCallRecordDao(db: WhisperDatabase): CallRecordDao = db.callRecordDao()
+}
@@ -0,0 +1,67 @@
+package com.whisper2.app.di
+
+import com.google.gson.Gson
+import com.whisper2.app.BuildConfig
+import com.whisper2.app.core.Constants
+import com.whisper2.app.data.network.api.AttachmentsApi
+import com.whisper2.app.data.network.api.WhisperApi
+import dagger.Module
+import dagger.Provides
+import dagger.hilt.InstallIn
+import dagger.hilt.components.SingletonComponent
+import okhttp3.OkHttpClient
+import okhttp3.logging.HttpLoggingInterceptor
+import retrofit2.Retrofit
+import retrofit2.converter.gson.GsonConverterFactory
+import java.util.concurrent.TimeUnit
+import javax.inject.Qualifier
+import javax.inject.Singleton
+
+@Qualifier @Retention(AnnotationRetention.BINARY) annotation class WebSocketClient
+@Qualifier @Retention(AnnotationRetention.BINARY) annotation class HttpClient
+
+@Module
+@InstallIn(SingletonComponent::class)
+object NetworkModule {
+
+    // Derived from the HTTP client via newBuilder(), which shares the
+    // underlying Dispatcher, ConnectionPool, and thread pools - two
+    // standalone clients would double the idle footprint for a config
+    // that only differs in timeouts.
+    @Provides @Singleton @WebSocketClient
+    fun provideWebSocketOkHttpClient(@HttpClient base: OkHttpClient): OkHttpClient = base.newBuilder()
+        .readTimeout(0, TimeUnit.SECONDS)
+        .writeTimeout(30, TimeUnit.SECONDS)
+        .pingInterval(30, TimeUnit.SECONDS)
+        .build()
+
+    @Provides @Singleton @HttpClient
+    fun provideHttpOkHttpClient(): OkHttpClient {
+        val builder = OkHttpClient.Builder()
+            .connectTimeout(30, TimeUnit.SECONDS)
+            .readTimeout(60, TimeUnit.SECONDS)
+            .writeTimeout(60, TimeUnit.SECONDS)
+            .retryOnConnectionFailure(true)
+
+        if (BuildConfig.DEBUG) {
+            builder.addInterceptor(HttpLoggingInterceptor().apply {
+                level = HttpLoggingInterceptor.Level.HEADERS
+            })
+        }
+        return builder.build()
+    }
+
+    @Provides @Singleton
+    fun provideRetrofit(@HttpClient okHttpClient: OkHttpClient, gson: Gson): Retrofit =
+        Retrofit.Builder()
+            .baseUrl(Constants.BASE_URL)
+            .client(okHttpClient)
+            .addConverterFactory(GsonConverterFactory.create(gson))
+            .build()
+
+    @Provides @Singleton
+    fun provideWhisperApi(retrofit: Retrofit): WhisperApi = retrofit.create(WhisperApi::class.java)
+
+    @Provides @Singleton
+    fun provideAttachmentsApi(retrofit: Retrofit): AttachmentsApi = retrofit.create(AttachmentsApi::class.java)
+}